@@ -0,0 +1,217 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from functools import wraps
+import logging
+from threading import Lock
+import time
+from typing import Any
+
+
+logger = logging.getLogger("ngx_dash")
+_MISSING = object()
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+class TTLCache:
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        maxsize: int,
+        sweep_interval_seconds: float = 60,
+        stale_ttl_seconds: float | Callable[[], float] = 0,
+        refresh_retry_seconds: float = 30,
+    ) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = max(1, maxsize)
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._stale_ttl_seconds = stale_ttl_seconds
+        self.refresh_retry_seconds = refresh_retry_seconds
+        self._refresh_retry_at: dict[Hashable, float] = {}
+        self._entries: OrderedDict[Hashable, tuple[float, float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self._next_sweep_at = time.monotonic() + sweep_interval_seconds
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    @property
+    def stale_ttl_seconds(self) -> float:
+        value = self._stale_ttl_seconds() if callable(self._stale_ttl_seconds) else self._stale_ttl_seconds
+        return max(0.0, float(value))
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        with self._lock:
+            _, value = self._lookup(key, time.monotonic(), allow_stale=False)
+        return default if value is _MISSING else value
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            now = time.monotonic()
+            fresh, value = self._lookup(key, now)
+            if fresh:
+                return value
+            flight = self._inflight.get(key)
+            if value is not _MISSING:
+                # After a failed refresh, keep serving the stale value until the retry backoff passes.
+                if flight is None and now >= self._refresh_retry_at.get(key, 0.0):
+                    flight = self._inflight[key] = Future()
+                    self.refreshes += 1
+                    # Run in the caller's context so contextvars such as background priority carry over.
+                    _refresh_executor.submit(copy_context().run, self._load, key, loader, flight, True)
+                return value
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.result()
+        return self._load(key, loader, flight, False)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_sweep(now)
+            expires_at = now + self.ttl_seconds
+            self._entries[key] = (expires_at, expires_at + self.stale_ttl_seconds, value)
+            self._refresh_retry_at.pop(key, None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                evicted, _ = self._entries.popitem(last=False)
+                self._refresh_retry_at.pop(evicted, None)
+                self.evictions += 1
+
+    def sweep(self) -> int:
+        with self._lock:
+            return self._sweep(time.monotonic())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._refresh_retry_at.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "ttl_seconds": self.ttl_seconds,
+                "stale_ttl_seconds": self.stale_ttl_seconds,
+                "maxsize": self.maxsize,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "coalesced": self.coalesced,
+                "inflight": len(self._inflight),
+                "refreshes": self.refreshes,
+                "refresh_failures": self.refresh_failures,
+            }
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], flight: Future, background: bool) -> Any:
+        try:
+            value = loader()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            if not background:
+                raise
+            with self._lock:
+                self.refresh_failures += 1
+                self._refresh_retry_at[key] = time.monotonic() + max(0.0, self.refresh_retry_seconds)
+            logger.warning("Background refresh for %s cache failed: %s", self.name, exc)
+            return None
+        else:
+            self.set(key, value)
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _lookup(self, key: Hashable, now: float, allow_stale: bool = True) -> tuple[bool, Any]:
+        self._maybe_sweep(now)
+        cached = self._entries.get(key)
+        if cached is not None:
+            expires_at, stale_until, value = cached
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            if stale_until > now:
+                if not allow_stale:
+                    self.misses += 1
+                    return False, _MISSING
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return False, value
+            del self._entries[key]
+            self._refresh_retry_at.pop(key, None)
+            self.expirations += 1
+        self.misses += 1
+        return False, _MISSING
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now >= self._next_sweep_at:
+            self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        expired = [key for key, (_, stale_until, _) in self._entries.items() if stale_until <= now]
+        for key in expired:
+            del self._entries[key]
+            self._refresh_retry_at.pop(key, None)
+        self.expirations += len(expired)
+        self._next_sweep_at = now + self.sweep_interval_seconds
+        return len(expired)
+
+
+_caches: dict[str, TTLCache] = {}
+_caches_lock = Lock()
+
+
+def register_cache(cache: TTLCache) -> TTLCache:
+    with _caches_lock:
+        _caches[cache.name] = cache
+    return cache
+
+
+def cache_stats() -> list[dict[str, Any]]:
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [cache.stats() for cache in sorted(caches, key=lambda item: item.name)]
+
+
+def sweep_caches() -> int:
+    with _caches_lock:
+        caches = list(_caches.values())
+    return sum(cache.sweep() for cache in caches)
+
+
+def cache_key(*args, **kwargs) -> Hashable:
+    return (args, tuple(sorted(kwargs.items())))
+
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 128, stale_ttl_seconds: float | Callable[[], float] = 0):
+    def decorator(func):
+        cache = register_cache(
+            TTLCache(func.__name__, ttl_seconds=ttl_seconds, maxsize=maxsize, stale_ttl_seconds=stale_ttl_seconds)
+        )
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_load(cache_key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
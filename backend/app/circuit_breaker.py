@@ -0,0 +1,132 @@
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+import time
+from typing import Any
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 20,
+        min_calls: int = 5,
+        failure_rate_threshold: float = 0.5,
+        open_seconds: float = 15,
+        max_open_seconds: float = 300,
+    ) -> None:
+        self.name = name
+        self.min_calls = max(1, min_calls)
+        self.failure_rate_threshold = failure_rate_threshold
+        self.base_open_seconds = max(0.0, open_seconds)
+        self.max_open_seconds = max(self.base_open_seconds, max_open_seconds)
+        self.state = CLOSED
+        self.trips = 0
+        self.rejected = 0
+        self._outcomes: deque[bool] = deque(maxlen=max(self.min_calls, window_size))
+        self._open_seconds = self.base_open_seconds
+        self._open_until = 0.0
+        self._opened_at: datetime | None = None
+        self._probe_in_flight = False
+        self._lock = Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() >= self._open_until:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if success:
+                    self._close()
+                else:
+                    self._open_seconds = min(self._open_seconds * 2, self.max_open_seconds)
+                    self._trip()
+                return
+            if self.state == OPEN:
+                return
+
+            self._outcomes.append(success)
+            if len(self._outcomes) >= self.min_calls and self._failure_rate() >= self.failure_rate_threshold:
+                self._trip()
+
+    def release(self) -> None:
+        # The call was abandoned (e.g. cancelled) without an upstream outcome; free the half-open probe.
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def retry_after(self) -> float:
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic()) if self.state == OPEN else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._close()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            remaining = max(0.0, self._open_until - time.monotonic()) if self.state == OPEN else 0.0
+            return {
+                "name": self.name,
+                "state": self.state,
+                "failure_rate": round(self._failure_rate(), 3),
+                "calls": len(self._outcomes),
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "open_seconds": self._open_seconds,
+                "opened_at": self._opened_at,
+                "retry_at": datetime.now(timezone.utc) + timedelta(seconds=remaining) if self.state == OPEN else None,
+            }
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def _trip(self) -> None:
+        self.state = OPEN
+        self.trips += 1
+        self._open_until = time.monotonic() + self._open_seconds
+        self._opened_at = datetime.now(timezone.utc)
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._outcomes.clear()
+        self._open_seconds = self.base_open_seconds
+        self._open_until = 0.0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = Lock()
+
+
+def get_circuit_breaker(name: str, **options: Any) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **options)
+        return breaker
+
+
+def circuit_breaker_states() -> list[dict[str, Any]]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return [breaker.snapshot() for breaker in sorted(breakers, key=lambda item: item.name)]
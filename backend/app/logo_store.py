@@ -0,0 +1,170 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import tempfile
+from threading import Lock
+
+from .settings import get_settings
+
+
+ROOT = Path(__file__).resolve().parents[2]
+CURATED_LOGO_DIR = ROOT / "flutter_app" / "assets" / "company_logos"
+SYMBOL_PATTERN = re.compile(r"[A-Z0-9][A-Z0-9._-]{0,31}")
+MEDIA_TYPE_SUFFIXES = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/svg+xml": ".svg",
+    "image/x-icon": ".ico",
+    "image/vnd.microsoft.icon": ".ico",
+}
+
+
+@dataclass(frozen=True)
+class StoredLogo:
+    path: Path
+    media_type: str
+    sha256: str
+    fetched_at: datetime | None = None
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+
+def normalize_logo_symbol(symbol: str) -> str | None:
+    symbol = symbol.strip().upper()
+    return symbol if SYMBOL_PATTERN.fullmatch(symbol) else None
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_name, path)
+    except BaseException:
+        _unlink_quietly(temp_name)
+        raise
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class LogoStore:
+    def __init__(
+        self,
+        root: Path,
+        curated_dir: Path = CURATED_LOGO_DIR,
+        ttl_seconds: int = 7 * 24 * 60 * 60,
+        negative_ttl_seconds: int = 24 * 60 * 60,
+    ) -> None:
+        self.root = root
+        self.curated_dir = curated_dir
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._curated_hashes: dict[Path, tuple[float, int, str]] = {}
+        self._lock = Lock()
+
+    def curated(self, symbol: str) -> StoredLogo | None:
+        path = self.curated_dir / f"{symbol}.png"
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        with self._lock:
+            cached = self._curated_hashes.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+            sha256 = cached[2]
+        else:
+            sha256 = _file_sha256(path)
+            with self._lock:
+                self._curated_hashes[path] = (stat.st_mtime, stat.st_size, sha256)
+        return StoredLogo(path=path, media_type="image/png", sha256=sha256)
+
+    def cached(self, symbol: str) -> StoredLogo | None:
+        try:
+            entry = self._read_entry(symbol)
+            sha256 = entry["sha256"]
+            path = self._blob_path(sha256, entry["media_type"])
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not path.is_file():
+            return None
+        return StoredLogo(path=path, media_type=entry["media_type"], sha256=sha256, fetched_at=fetched_at)
+
+    def is_fresh(self, logo: StoredLogo) -> bool:
+        if logo.fetched_at is None:
+            return True
+        return datetime.now(timezone.utc) - logo.fetched_at <= timedelta(seconds=max(0, self.ttl_seconds))
+
+    def recently_missed(self, symbol: str) -> bool:
+        try:
+            missed_at = datetime.fromisoformat(self._read_entry(symbol)["missed_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return datetime.now(timezone.utc) - missed_at <= timedelta(seconds=max(0, self.negative_ttl_seconds))
+
+    def record_miss(self, symbol: str) -> None:
+        # Keep any stale logo so it can still be served while refetches are suppressed.
+        try:
+            entry = self._read_entry(symbol)
+        except (OSError, ValueError):
+            entry = {}
+        if not isinstance(entry, dict):
+            entry = {}
+        entry["missed_at"] = datetime.now(timezone.utc).isoformat()
+        _write_atomic(self.root / "symbols" / f"{symbol}.json", json.dumps(entry).encode("utf-8"))
+
+    def store(self, symbol: str, content: bytes, media_type: str) -> StoredLogo:
+        sha256 = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(sha256, media_type)
+        if not path.is_file():
+            _write_atomic(path, content)
+
+        fetched_at = datetime.now(timezone.utc)
+        entry = {"sha256": sha256, "media_type": media_type, "fetched_at": fetched_at.isoformat()}
+        _write_atomic(self.root / "symbols" / f"{symbol}.json", json.dumps(entry).encode("utf-8"))
+        return StoredLogo(path=path, media_type=media_type, sha256=sha256, fetched_at=fetched_at)
+
+    def _read_entry(self, symbol: str) -> dict:
+        return json.loads((self.root / "symbols" / f"{symbol}.json").read_text(encoding="utf-8"))
+
+    def _blob_path(self, sha256: str, media_type: str) -> Path:
+        suffix = MEDIA_TYPE_SUFFIXES.get(media_type, ".bin")
+        return self.root / "blobs" / sha256[:2] / f"{sha256}{suffix}"
+
+
+_logo_store: LogoStore | None = None
+
+
+def get_logo_store() -> LogoStore:
+    global _logo_store
+    if _logo_store is None:
+        settings = get_settings()
+        _logo_store = LogoStore(
+            Path(settings.logo_cache_dir),
+            ttl_seconds=settings.logo_cache_ttl_seconds,
+            negative_ttl_seconds=settings.logo_cache_negative_ttl_seconds,
+        )
+    return _logo_store
@@ -8,31 +8,46 @@ from datetime import date, datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse
 from sqlalchemy import desc, func, select, text
 from sqlalchemy.orm import Session, selectinload
 
 from .auth import create_access_token, get_current_superuser, get_current_user, hash_password, verify_password
+from .cache import TTLCache, cache_key, cache_stats, register_cache, sweep_caches
 from .database import Base, SessionLocal, engine, get_db
 from .legal import render_account_deletion_html, render_privacy_policy_html
-from .models import AccountDeletionRequest, PortfolioHolding, PushDeviceToken, Stock, StockPrice, User
+from .logo_store import get_logo_store, normalize_logo_symbol
+from .models import (
+    COMPANY_NEWS_SEARCH_EXPRESSION,
+    FINANCIAL_STATEMENT_EXPRESSION,
+    AccountDeletionRequest,
+    PortfolioHolding,
+    PushDeviceToken,
+    Stock,
+    StockHistorySyncState,
+    StockProfile,
+    StockReturn,
+    User,
+)
 from .notifications import portfolio_report_pdf, send_email
+from .ngx_async_client import close_async_ngx_client, get_async_ngx_client
 from .ngx_client import (
     NgxFetchError,
-    discover_stock_ngx_id,
-    fetch_all_stocks_from_ngx_cached,
-    fetch_company_news_cached,
+    fetch_company_news_batch,
     fetch_company_news_from_ngx,
     fetch_market_snapshot_cached,
     fetch_market_snapshot_from_ngx,
-    fetch_stock_logo,
+    fetch_website_favicon,
 )
 from .push import PushDeliveryError, dispatch_portfolio_price_alerts, remove_push_token, send_push_message, upsert_push_token
+from .rate_limiter import background_priority
 from .schemas import (
     AccountDeleteRequest,
     AccountDeletionRequestCreate,
     AccountDeletionRequestOut,
+    CacheStatsOut,
     CompanyNewsOut,
+    CompanyNewsSearchOut,
     HoldingOut,
     HoldingUpsert,
     LoginRequest,
@@ -60,13 +75,21 @@ from .schemas import (
     TokenResponse,
     UserOut,
 )
+from .scoring import IDEA_COLUMNS, idea_metrics, score_universe, top_ideas
 from .services import (
+    company_news_query,
     delete_holding,
     get_cached_market_status,
+    get_stock_profile,
     holding_to_dict,
+    latest_company_news,
+    live_company_news,
     record_sync_log,
     refresh_market_status,
+    search_company_news,
+    stock_close_range_since,
     stock_history_query,
+    sync_generation,
     sync_logs_query,
     sync_status,
     sync_stocks,
@@ -92,13 +115,23 @@ MARKET_IDEAS_DISCLAIMER = (
     "Stockfolio NG highlights data-driven watchlist ideas only. "
     "It is not a financial adviser app. Contact your broker for detailed analysis."
 )
+# "1d" is the intraday ranking on stocks; the others are the stock_returns periods.
+LEADER_WINDOW_PATTERN = "^(1d|1w|1m|3m|ytd|1y)$"
+market_payload_cache = register_cache(
+    TTLCache("market_payloads", ttl_seconds=settings.market_payload_cache_ttl_seconds, maxsize=64)
+)
 
 
-def stock_history_is_stale(rows: list) -> bool:
+def stock_history_is_stale(db: Session, symbol: str, rows: list) -> bool:
     if not rows:
         return True
 
-    latest_updated_at = max((row.updated_at for row in rows if row.updated_at), default=None)
+    # The sync state records every chart fetch, even when no price row changed.
+    state = db.get(StockHistorySyncState, symbol)
+    if state is not None and state.last_fetched_at is not None:
+        latest_updated_at = state.last_fetched_at
+    else:
+        latest_updated_at = max((row.updated_at for row in rows if row.updated_at), default=None)
     if latest_updated_at is None:
         return True
     if latest_updated_at.tzinfo is None:
@@ -108,78 +141,55 @@ def stock_history_is_stale(rows: list) -> bool:
     return datetime.now(timezone.utc) - latest_updated_at > refresh_after
 
 
-def intraday_leader_payload(stock: Stock) -> dict | None:
-    current_price = float(stock.last_price) if stock.last_price is not None else None
-    opening_price = float(stock.open_price) if stock.open_price is not None else None
-    if current_price is None or opening_price is None or opening_price <= 0:
-        return None
-
-    change = current_price - opening_price
-    percent_change = (change / opening_price) * 100
+def intraday_leader_payload(stock: Stock) -> dict:
     payload = StockOut.model_validate(stock).model_dump()
-    payload["change"] = change
-    payload["percent_change"] = percent_change
+    payload["change"] = float(stock.intraday_change) if stock.intraday_change is not None else None
+    payload["percent_change"] = (
+        float(stock.intraday_percent_change) if stock.intraday_percent_change is not None else None
+    )
     return payload
 
 
-def intraday_leader_payload_from_dict(stock: dict) -> dict | None:
-    current_price = float(stock["last_price"]) if stock.get("last_price") is not None else None
-    opening_price = float(stock["open_price"]) if stock.get("open_price") is not None else None
-    if current_price is None or opening_price is None or opening_price <= 0:
-        return None
-
-    payload = dict(stock)
-    payload["change"] = current_price - opening_price
-    payload["percent_change"] = (payload["change"] / opening_price) * 100
-    payload.setdefault("source", "ngx_doclib_live")
+def period_leader_payload(stock: Stock, stock_return: StockReturn) -> dict:
+    payload = StockOut.model_validate(stock).model_dump()
+    payload["change"] = float(stock_return.change)
+    payload["percent_change"] = float(stock_return.percent_change)
     return payload
 
 
-def market_leaders_payload(db: Session, limit: int) -> dict:
-    stocks = db.scalars(
-        select(Stock)
-        .where(Stock.last_price.is_not(None), Stock.open_price.is_not(None))
-        .order_by(Stock.symbol)
-    ).all()
-    ranked = [payload for stock in stocks if (payload := intraday_leader_payload(stock)) is not None]
-    if len(ranked) < max(2, limit):
-        try:
-            live_ranked = [
-                payload
-                for stock in fetch_all_stocks_from_ngx_cached()
-                if (payload := intraday_leader_payload_from_dict(stock)) is not None
-            ]
-        except NgxFetchError as exc:
-            logger.warning("Live market leaders fallback failed: %s", exc)
-        else:
-            if live_ranked:
-                ranked = live_ranked
-    ranked.sort(key=lambda item: (item["percent_change"], item["symbol"]), reverse=True)
+def market_leaders_payload(db: Session, limit: int, window: str = "1d") -> dict:
+    # Ranks are written by sync_stocks: 1 is the top mover and the highest rank the worst loser.
+    if window == "1d":
+        ranked = select(Stock).where(Stock.intraday_rank.is_not(None))
+        top_movers = db.scalars(ranked.order_by(Stock.intraday_rank).limit(limit)).all()
+        top_losers = db.scalars(ranked.order_by(Stock.intraday_rank.desc()).limit(limit)).all()
+        return {
+            "window": window,
+            "top_movers": [intraday_leader_payload(stock) for stock in top_movers],
+            "top_losers": [intraday_leader_payload(stock) for stock in top_losers],
+        }
+
+    ranked = (
+        select(Stock, StockReturn)
+        .join(StockReturn, StockReturn.stock_symbol == Stock.symbol)
+        .where(StockReturn.period == window)
+    )
+    top_movers = db.execute(ranked.order_by(StockReturn.rank).limit(limit)).all()
+    top_losers = db.execute(ranked.order_by(StockReturn.rank.desc()).limit(limit)).all()
     return {
-        "top_movers": ranked[:limit],
-        "top_losers": sorted(ranked, key=lambda item: (item["percent_change"], item["symbol"]))[:limit],
+        "window": window,
+        "top_movers": [period_leader_payload(stock, stock_return) for stock, stock_return in top_movers],
+        "top_losers": [period_leader_payload(stock, stock_return) for stock, stock_return in top_losers],
     }
 
 
-def _percentile(sorted_values: list[float], value: float | None) -> float:
-    if value is None or not sorted_values:
-        return 0.0
-    less_or_equal = 0
-    for candidate in sorted_values:
-        if candidate <= value:
-            less_or_equal += 1
-    return less_or_equal / len(sorted_values)
-
-
 def market_ideas_payload(db: Session, limit: int) -> dict:
-    stocks = list(
-        db.scalars(
-            select(Stock)
-            .where(Stock.last_price.is_not(None), Stock.open_price.is_not(None))
-            .order_by(Stock.symbol)
-        ).all()
-    )
-    if not stocks:
+    rows = db.execute(
+        select(Stock.symbol, *(getattr(Stock, column) for column in IDEA_COLUMNS))
+        .where(Stock.last_price.is_not(None), Stock.open_price.is_not(None))
+        .order_by(Stock.symbol)
+    ).all()
+    if not rows:
         return {
             "disclaimer": MARKET_IDEAS_DISCLAIMER,
             "generated_at": datetime.now(timezone.utc),
@@ -187,56 +197,28 @@ def market_ideas_payload(db: Session, limit: int) -> dict:
             "ideas": [],
         }
 
-    one_year_since = date.today() - relativedelta(years=1)
-    history_rows = list(
-        db.scalars(
-            select(StockPrice)
-            .where(StockPrice.trade_date >= one_year_since)
-            .order_by(StockPrice.stock_symbol, StockPrice.trade_date)
-        ).all()
-    )
-    history_by_symbol: dict[str, tuple[float, float]] = {}
-    for row in history_rows:
-        symbol = row.stock_symbol
-        close_price = float(row.close_price)
-        if symbol not in history_by_symbol:
-            history_by_symbol[symbol] = (close_price, close_price)
-        else:
-            first_close, _ = history_by_symbol[symbol]
-            history_by_symbol[symbol] = (first_close, close_price)
-
-    volumes = sorted(float(stock.volume) for stock in stocks if stock.volume is not None and float(stock.volume) > 0)
-    market_caps = sorted(
-        float(stock.market_cap) for stock in stocks if stock.market_cap is not None and float(stock.market_cap) > 0
+    symbols = [row[0] for row in rows]
+    scores = score_universe(
+        symbols,
+        {column: [row[index + 1] for row in rows] for index, column in enumerate(IDEA_COLUMNS)},
+        stock_close_range_since(db, date.today() - relativedelta(years=1)),
     )
+    shortlist = top_ideas(scores, max(limit * 2, 6))
+    stocks_by_symbol = {
+        stock.symbol: stock
+        for stock in db.scalars(select(Stock).where(Stock.symbol.in_([symbols[index] for index in shortlist])))
+    }
 
-    candidates: list[dict] = []
-    for stock in stocks:
-        current_price = float(stock.last_price) if stock.last_price is not None else None
-        opening_price = float(stock.open_price) if stock.open_price is not None else None
-        if current_price is None or opening_price is None or opening_price <= 0:
-            continue
-
-        intraday_change = ((current_price - opening_price) / opening_price) * 100
-        volume_score = _percentile(volumes, float(stock.volume) if stock.volume is not None else None)
-        market_cap_score = _percentile(market_caps, float(stock.market_cap) if stock.market_cap is not None else None)
-        margin_value = float(stock.margin) if stock.margin is not None else None
-        margin_score = 0.0 if margin_value is None else max(0.0, 1.0 - min(margin_value, 10.0) / 10.0)
-        close_strength = 0.0
-        if stock.previous_close is not None and current_price > float(stock.previous_close):
-            close_strength = 1.0
-        growth_tuple = history_by_symbol.get(stock.symbol)
-        one_year_growth_percent: float | None = None
-        if growth_tuple is not None and growth_tuple[0] > 0:
-            one_year_growth_percent = ((growth_tuple[1] - growth_tuple[0]) / growth_tuple[0]) * 100
-
-        score = max(0.0, min(intraday_change, 10.0)) * 4.0
-        score += volume_score * 25.0
-        score += market_cap_score * 15.0
-        score += margin_score * 10.0
-        score += close_strength * 10.0
-        if one_year_growth_percent is not None:
-            score += max(-10.0, min(one_year_growth_percent, 40.0)) * 0.7
+    shortlisted: list[dict] = []
+    for index in shortlist:
+        stock = stocks_by_symbol[symbols[index]]
+        metrics = idea_metrics(scores, index)
+        intraday_change = metrics["intraday_change"]
+        volume_score = metrics["volume_score"]
+        market_cap_score = metrics["market_cap_score"]
+        margin_value = metrics["margin"]
+        close_strength = metrics["close_strength"]
+        one_year_growth_percent = metrics["one_year_growth_percent"]
 
         rationale: list[str] = []
         if intraday_change > 0:
@@ -254,12 +236,12 @@ def market_ideas_payload(db: Session, limit: int) -> dict:
         if stock.sector:
             rationale.append(f"Sector: {stock.sector}.")
 
-        candidates.append(
+        shortlisted.append(
             {
                 "stock": StockOut.model_validate(stock).model_dump(),
-                "score": round(score, 2),
+                "score": round(metrics["score"], 2),
                 "one_year_growth_percent": None if one_year_growth_percent is None else round(one_year_growth_percent, 2),
-                "stocks_analyzed": len(stocks),
+                "stocks_analyzed": len(rows),
                 "rationale": rationale[:4],
                 "web_summary": None,
                 "price_to_earnings_ratio": None,
@@ -269,91 +251,101 @@ def market_ideas_payload(db: Session, limit: int) -> dict:
             }
         )
 
-    candidates.sort(key=lambda item: (item["score"], item["stock"]["symbol"]), reverse=True)
+    symbols_by_ngx_id = {
+        candidate["ngx_id"]: candidate["stock"]["symbol"] for candidate in shortlisted if candidate["ngx_id"]
+    }
+    latest_news = latest_company_news(db, list(symbols_by_ngx_id))
+    news_by_ngx_id, news_errors = fetch_company_news_batch(
+        ngx_id for ngx_id in symbols_by_ngx_id if ngx_id not in latest_news
+    )
+    for ngx_id, news in news_by_ngx_id.items():
+        if news:
+            latest_news[ngx_id] = live_company_news(news[:1])[0]
+    for ngx_id, exc in news_errors.items():
+        logger.warning("Company news fetch failed while building ideas for %s: %s", symbols_by_ngx_id[ngx_id], exc)
+
     enriched: list[dict] = []
-    for candidate in candidates[: max(limit * 2, 6)]:
+    for candidate in shortlisted:
         ngx_id = candidate.pop("ngx_id", None)
-        if ngx_id:
-            try:
-                news = fetch_company_news_cached(ngx_id)
-            except NgxFetchError as exc:
-                logger.warning("Company news fetch failed while building ideas for %s: %s", candidate["stock"]["symbol"], exc)
-            else:
-                if news:
-                    latest = news[0]
-                    candidate["web_summary"] = latest.get("title") or latest.get("submission_type")
-                    candidate["score"] = round(candidate["score"] + 5.0, 2)
-                    candidate["rationale"] = [
-                        *candidate["rationale"],
-                        "Recent company update/disclosure is available from NGX sources.",
-                    ][:5]
-                    latest_title = (latest.get("title") or "").lower()
-                    if any(
-                        keyword in latest_title
-                        for keyword in ("audited", "annual report", "financial statement", "q1", "q2", "q3", "q4")
-                    ):
-                        candidate["rationale"] = [
-                            *candidate["rationale"],
-                            "Latest filing references recent financial statements from the previous reporting period.",
-                        ][:5]
+        latest = latest_news.get(ngx_id) if ngx_id else None
+        if latest:
+            candidate["web_summary"] = latest.get("title") or latest.get("submission_type")
+            candidate["score"] = round(candidate["score"] + 5.0, 2)
+            candidate["rationale"] = [
+                *candidate["rationale"],
+                "Recent company update/disclosure is available from NGX sources.",
+            ][:5]
+            if latest.get("financial_statement"):
+                candidate["rationale"] = [
+                    *candidate["rationale"],
+                    "Latest filing references recent financial statements from the previous reporting period.",
+                ][:5]
         enriched.append(candidate)
 
     enriched.sort(key=lambda item: (item["score"], item["stock"]["symbol"]), reverse=True)
     return {
         "disclaimer": MARKET_IDEAS_DISCLAIMER,
         "generated_at": datetime.now(timezone.utc),
-        "stocks_analyzed": len(stocks),
+        "stocks_analyzed": len(rows),
         "ideas": enriched[:limit],
     }
 
 
-def ensure_stock_ngx_id(db: Session, stock: Stock) -> str | None:
+def cached_market_payload(db: Session, kind: str, limit: int, **options) -> dict:
+    # Payloads only change when a sync commits, so they are keyed on the sync generation.
+    generation = sync_generation(db)
+    build = market_leaders_payload if kind == "leaders" else market_ideas_payload
+    return market_payload_cache.get_or_load(
+        cache_key(kind, generation, limit, **options),
+        lambda: {**build(db, limit, **options), "generation": generation},
+    )
+
+
+def stock_ngx_id(db: Session, stock: Stock) -> str | None:
     if stock.ngx_id:
         return stock.ngx_id
 
-    try:
-        discovered = discover_stock_ngx_id(stock.symbol)
-    except NgxFetchError as exc:
-        logger.warning("NGX chart id discovery failed for %s: %s", stock.symbol, exc)
-        return None
-
-    if discovered:
-        stock.ngx_id = discovered
-        db.commit()
-        db.refresh(stock)
-    return stock.ngx_id
+    profile = db.get(StockProfile, stock.symbol)
+    return profile.ngx_id if profile is not None else None
 
 
 async def background_stock_sync_loop() -> None:
     interval = max(1, settings.stock_sync_interval_seconds)
-    while True:
-        db = SessionLocal()
-        try:
-            await asyncio.to_thread(sync_stocks, db, False)
-            await asyncio.to_thread(refresh_market_status, db)
-            if settings.push_enabled:
-                result = await asyncio.to_thread(dispatch_portfolio_price_alerts, db, settings)
-                if result["alerts_sent"]:
-                    logger.info(
-                        "Sent %s portfolio push alerts to %s device tokens",
-                        result["alerts_sent"],
-                        result["tokens_sent"],
+    with background_priority():
+        while True:
+            db = SessionLocal()
+            try:
+                try:
+                    prefetched_stocks = await get_async_ngx_client().fetch_all_stocks()
+                except NgxFetchError as exc:
+                    logger.warning("Async NGX ticker fetch failed, retrying in sync_stocks: %s", exc)
+                    prefetched_stocks = None
+                await asyncio.to_thread(sync_stocks, db, False, prefetched_stocks)
+                await asyncio.to_thread(refresh_market_status, db)
+                if settings.push_enabled:
+                    result = await asyncio.to_thread(dispatch_portfolio_price_alerts, db, settings)
+                    if result["alerts_sent"]:
+                        logger.info(
+                            "Sent %s portfolio push alerts to %s device tokens",
+                            result["alerts_sent"],
+                            result["tokens_sent"],
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.exception("Background stock sync failed")
+                with suppress(Exception):
+                    record_sync_log(
+                        db,
+                        status="failed",
+                        source="background_sync",
+                        message=f"Background stock sync failed: {exc}",
                     )
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:
-            logger.exception("Background stock sync failed")
-            with suppress(Exception):
-                record_sync_log(
-                    db,
-                    status="failed",
-                    source="background_sync",
-                    message=f"Background stock sync failed: {exc}",
-                )
-                db.commit()
-        finally:
-            db.close()
-        await asyncio.sleep(interval)
+                    db.commit()
+            finally:
+                db.close()
+            sweep_caches()
+            await asyncio.sleep(interval)
 
 
 def ensure_runtime_schema() -> None:
@@ -373,6 +365,29 @@ def ensure_runtime_schema() -> None:
             text("CREATE INDEX IF NOT EXISTS ix_users_email_verification_token ON users(email_verification_token)")
         )
         conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_password_reset_token ON users(password_reset_token)"))
+        conn.execute(text("ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS stage_timings TEXT"))
+        conn.execute(text("ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS stocks_changed INTEGER NOT NULL DEFAULT 0"))
+        conn.execute(text("ALTER TABLE sync_logs ADD COLUMN IF NOT EXISTS stocks_unchanged INTEGER NOT NULL DEFAULT 0"))
+        conn.execute(text("ALTER TABLE stocks ADD COLUMN IF NOT EXISTS row_fingerprint VARCHAR(64)"))
+        conn.execute(text("ALTER TABLE stocks ADD COLUMN IF NOT EXISTS intraday_change NUMERIC(18, 4)"))
+        conn.execute(text("ALTER TABLE stocks ADD COLUMN IF NOT EXISTS intraday_percent_change NUMERIC(10, 4)"))
+        conn.execute(text("ALTER TABLE stocks ADD COLUMN IF NOT EXISTS intraday_rank INTEGER"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_stocks_intraday_rank ON stocks(intraday_rank)"))
+        conn.execute(
+            text(
+                "ALTER TABLE company_news ADD COLUMN IF NOT EXISTS is_financial_statement BOOLEAN "
+                f"GENERATED ALWAYS AS ({FINANCIAL_STATEMENT_EXPRESSION}) STORED"
+            )
+        )
+        conn.execute(
+            text(
+                "ALTER TABLE company_news ADD COLUMN IF NOT EXISTS search_vector TSVECTOR "
+                f"GENERATED ALWAYS AS ({COMPANY_NEWS_SEARCH_EXPRESSION}) STORED"
+            )
+        )
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_company_news_search_vector ON company_news USING GIN (search_vector)")
+        )
         conn.execute(
             text(
                 """
@@ -389,6 +404,7 @@ def ensure_runtime_schema() -> None:
             )
         )
         conn.execute(text("CREATE INDEX IF NOT EXISTS ix_market_status_status ON market_status(status)"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_stock_prices_symbol_date_close"))
         conn.execute(
             text(
                 """
@@ -412,11 +428,11 @@ async def startup() -> None:
 
 @app.on_event("shutdown")
 async def shutdown() -> None:
-    if stock_sync_task is None:
-        return
-    stock_sync_task.cancel()
-    with suppress(asyncio.CancelledError):
-        await stock_sync_task
+    if stock_sync_task is not None:
+        stock_sync_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await stock_sync_task
+    await close_async_ngx_client()
 
 
 @app.get("/health")
@@ -425,22 +441,36 @@ def health() -> dict[str, str]:
 
 
 @app.get("/public/stocks/{symbol}/logo", include_in_schema=False)
-def public_stock_logo(symbol: str) -> Response:
-    try:
-        logo = fetch_stock_logo(symbol)
-    except NgxFetchError as exc:
-        logger.warning("Stock logo fetch failed for %s: %s", symbol, exc)
-        raise HTTPException(status_code=404, detail="Logo not found") from exc
+def public_stock_logo(symbol: str, request: Request, db: Session = Depends(get_db)) -> Response:
+    symbol = normalize_logo_symbol(symbol)
+    if symbol is None or db.get(Stock, symbol) is None:
+        raise HTTPException(status_code=404, detail="Logo not found")
+
+    store = get_logo_store()
+    logo = store.curated(symbol)
+    if logo is None:
+        logo = store.cached(symbol)
+        if (logo is None or not store.is_fresh(logo)) and not store.recently_missed(symbol):
+            try:
+                profile = get_stock_profile(db, symbol)
+                db.commit()
+                fetched = fetch_website_favicon(profile.website_domain) if profile and profile.website_domain else None
+            except NgxFetchError as exc:
+                logger.warning("Stock logo fetch failed for %s: %s", symbol, exc)
+                fetched = None
+            if fetched is not None:
+                logo = store.store(symbol, *fetched)
+            else:
+                store.record_miss(symbol)
 
     if logo is None:
         raise HTTPException(status_code=404, detail="Logo not found")
 
-    content, media_type = logo
-    return Response(
-        content=content,
-        media_type=media_type,
-        headers={"Cache-Control": "public, max-age=86400"},
-    )
+    headers = {"Cache-Control": "public, max-age=86400", "ETag": logo.etag}
+    if_none_match = request.headers.get("if-none-match", "")
+    if any(tag.strip().removeprefix("W/") in (logo.etag, "*") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(logo.path, media_type=logo.media_type, headers=headers)
 
 
 @app.get("/public/market/status", response_model=MarketStatusOut, include_in_schema=False)
@@ -451,9 +481,10 @@ def public_market_status(db: Session = Depends(get_db)) -> dict:
 @app.get("/public/market/leaders", response_model=MarketLeadersOut, include_in_schema=False)
 def public_market_leaders(
     limit: int = Query(default=6, ge=1, le=20),
+    window: str = Query(default="1d", pattern=LEADER_WINDOW_PATTERN),
     db: Session = Depends(get_db),
 ) -> dict:
-    return market_leaders_payload(db, limit)
+    return cached_market_payload(db, "leaders", limit, window=window)
 
 
 @app.get("/public/privacy-policy", include_in_schema=False, response_class=HTMLResponse)
@@ -841,10 +872,11 @@ def get_market_snapshot(_: User = Depends(get_current_user)) -> dict:
 @app.get("/market/leaders", response_model=MarketLeadersOut)
 def get_market_leaders(
     limit: int = Query(default=5, ge=1, le=20),
+    window: str = Query(default="1d", pattern=LEADER_WINDOW_PATTERN),
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ) -> dict:
-    return market_leaders_payload(db, limit)
+    return cached_market_payload(db, "leaders", limit, window=window)
 
 
 @app.get("/market/ideas", response_model=MarketIdeasOut)
@@ -853,7 +885,7 @@ def get_market_ideas(
     db: Session = Depends(get_db),
     _: User = Depends(get_current_user),
 ) -> dict:
-    return market_ideas_payload(db, limit)
+    return cached_market_payload(db, "ideas", limit)
 
 
 @app.get("/stocks", response_model=list[StockOut])
@@ -887,16 +919,28 @@ def get_stock_company_news(
     stock = db.get(Stock, symbol.strip().upper())
     if stock is None:
         raise HTTPException(status_code=404, detail="Stock not found")
-    ngx_id = ensure_stock_ngx_id(db, stock)
+    ngx_id = stock_ngx_id(db, stock)
     if not ngx_id:
         return []
     try:
-        return fetch_company_news_cached(ngx_id)[:limit]
+        return company_news_query(db, ngx_id, limit)
     except NgxFetchError as exc:
         logger.warning("Company news fetch failed for %s: %s", stock.symbol, exc)
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
 
+@app.get("/company-news/search", response_model=list[CompanyNewsSearchOut])
+def get_company_news_search(
+    q: str = Query(min_length=2, max_length=200),
+    symbol: str | None = Query(default=None, max_length=32),
+    financial_only: bool = False,
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+) -> list[dict]:
+    return search_company_news(db, q, limit, symbol, financial_only)
+
+
 @app.get("/stocks/{symbol}/history", response_model=list[StockPriceOut])
 def get_stock_history(
     symbol: str,
@@ -908,13 +952,13 @@ def get_stock_history(
     if stock is None:
         raise HTTPException(status_code=404, detail="Stock not found")
 
-    ngx_id = ensure_stock_ngx_id(db, stock)
+    ngx_id = stock_ngx_id(db, stock)
     since = date.today() - relativedelta(months=months)
     rows = stock_history_query(db, symbol, since)
     if ngx_id and (
         not rows
         or any(row.open_price is None for row in rows)
-        or stock_history_is_stale(rows)
+        or stock_history_is_stale(db, stock.symbol, rows)
     ):
         upsert_stock_history(db, stock.symbol, ngx_id)
         db.commit()
@@ -932,10 +976,14 @@ def build_stock_detail(
     if stock is None:
         raise HTTPException(status_code=404, detail="Stock not found")
 
-    ngx_id = ensure_stock_ngx_id(db, stock)
+    ngx_id = stock_ngx_id(db, stock)
     since = date.today() - relativedelta(months=months)
     rows = stock_history_query(db, symbol, since)
-    if ngx_id and (not rows or any(row.open_price is None for row in rows) or stock_history_is_stale(rows)):
+    if ngx_id and (
+        not rows
+        or any(row.open_price is None for row in rows)
+        or stock_history_is_stale(db, stock.symbol, rows)
+    ):
         upsert_stock_history(db, stock.symbol, ngx_id)
         db.commit()
         db.refresh(stock)
@@ -950,7 +998,7 @@ def build_stock_detail(
     news: list[dict] = []
     if ngx_id:
         try:
-            news = fetch_company_news_cached(ngx_id)[:news_limit]
+            news = company_news_query(db, ngx_id, news_limit)
         except NgxFetchError as exc:
             logger.warning("Company news fetch failed for %s detail: %s", stock.symbol, exc)
 
@@ -1013,6 +1061,11 @@ def get_sync_logs(
     return sync_logs_query(db, limit)
 
 
+@app.get("/admin/cache/stats", response_model=list[CacheStatsOut])
+def get_cache_stats(_: User = Depends(get_current_superuser)) -> list[dict]:
+    return cache_stats()
+
+
 @app.get("/admin/email/status")
 def get_email_status(_: User = Depends(get_current_superuser)) -> dict:
     return {
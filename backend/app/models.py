@@ -1,11 +1,31 @@
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Computed,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
 
 
+COMPANY_NEWS_SEARCH_EXPRESSION = "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(submission_type, ''))"
+FINANCIAL_STATEMENT_PATTERN = "(audited|annual report|financial statement|q[1-4])"
+FINANCIAL_STATEMENT_EXPRESSION = f"coalesce(lower(title), '') ~ '{FINANCIAL_STATEMENT_PATTERN}'"
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
@@ -56,7 +76,11 @@ class Stock(TimestampMixin, Base):
     change: Mapped[float | None] = mapped_column(Numeric(18, 4), nullable=True)
     percent_change: Mapped[float | None] = mapped_column(Numeric(10, 4), nullable=True)
     margin: Mapped[float | None] = mapped_column(Numeric(10, 4), nullable=True)
+    intraday_change: Mapped[float | None] = mapped_column(Numeric(18, 4), nullable=True)
+    intraday_percent_change: Mapped[float | None] = mapped_column(Numeric(10, 4), nullable=True)
+    intraday_rank: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     source: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    row_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     prices: Mapped[list["StockPrice"]] = relationship(back_populates="stock", cascade="all, delete-orphan")
     holdings: Mapped[list["PortfolioHolding"]] = relationship(back_populates="stock")
@@ -64,7 +88,9 @@ class Stock(TimestampMixin, Base):
 
 class StockPrice(TimestampMixin, Base):
     __tablename__ = "stock_prices"
-    __table_args__ = (UniqueConstraint("stock_symbol", "trade_date", name="uq_stock_prices_symbol_date"),)
+    __table_args__ = (
+        UniqueConstraint("stock_symbol", "trade_date", name="uq_stock_prices_symbol_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     stock_symbol: Mapped[str] = mapped_column(ForeignKey("stocks.symbol", ondelete="CASCADE"), index=True)
@@ -78,6 +104,57 @@ class StockPrice(TimestampMixin, Base):
     stock: Mapped[Stock] = relationship(back_populates="prices")
 
 
+class StockReturn(TimestampMixin, Base):
+    __tablename__ = "stock_returns"
+    __table_args__ = (Index("ix_stock_returns_period_rank", "period", "rank"),)
+
+    stock_symbol: Mapped[str] = mapped_column(ForeignKey("stocks.symbol", ondelete="CASCADE"), primary_key=True)
+    period: Mapped[str] = mapped_column(String(8), primary_key=True)
+    start_date: Mapped[date] = mapped_column(Date)
+    start_close: Mapped[float] = mapped_column(Numeric(18, 4))
+    end_date: Mapped[date] = mapped_column(Date)
+    end_close: Mapped[float] = mapped_column(Numeric(18, 4))
+    change: Mapped[float] = mapped_column(Numeric(18, 4))
+    percent_change: Mapped[float] = mapped_column(Numeric(12, 4))
+    rank: Mapped[int] = mapped_column(Integer)
+
+
+class StockProfile(TimestampMixin, Base):
+    __tablename__ = "stock_profiles"
+
+    symbol: Mapped[str] = mapped_column(String(32), primary_key=True)
+    ngx_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    website_domain: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+
+
+class StockHistorySyncState(TimestampMixin, Base):
+    __tablename__ = "stock_history_sync_state"
+
+    stock_symbol: Mapped[str] = mapped_column(ForeignKey("stocks.symbol", ondelete="CASCADE"), primary_key=True)
+    last_trade_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class CompanyNews(TimestampMixin, Base):
+    __tablename__ = "company_news"
+    __table_args__ = (
+        Index("ix_company_news_ngx_id_modified", "ngx_id", "modified"),
+        Index("ix_company_news_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
+    item_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    ngx_id: Mapped[str] = mapped_column(String(64))
+    title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    submission_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    modified: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    is_financial_statement: Mapped[bool] = mapped_column(
+        Boolean, Computed(FINANCIAL_STATEMENT_EXPRESSION, persisted=True)
+    )
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, Computed(COMPANY_NEWS_SEARCH_EXPRESSION, persisted=True))
+
+
 class SyncLog(TimestampMixin, Base):
     __tablename__ = "sync_logs"
 
@@ -85,8 +162,11 @@ class SyncLog(TimestampMixin, Base):
     status: Mapped[str] = mapped_column(String(32), index=True)
     source: Mapped[str] = mapped_column(String(64), index=True)
     stocks_upserted: Mapped[int] = mapped_column(Integer, default=0)
+    stocks_changed: Mapped[int] = mapped_column(Integer, default=0)
+    stocks_unchanged: Mapped[int] = mapped_column(Integer, default=0)
     history_rows_upserted: Mapped[int] = mapped_column(Integer, default=0)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    stage_timings: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
 class MarketStatus(TimestampMixin, Base):
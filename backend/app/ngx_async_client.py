@@ -0,0 +1,179 @@
+import asyncio
+import time
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from .ngx_client import (
+    JSON_HEADERS,
+    NEWS_HEADERS,
+    PROFILE_HEADERS,
+    SNAPSHOT_HEADERS,
+    TICKER_PARAMS,
+    NgxFetchError,
+    circuit_open_error,
+    company_news_params,
+    company_profile_params,
+    endpoint_circuit,
+    endpoint_rate_limit,
+    endpoint_timeout,
+    is_upstream_failure,
+    parse_chart_payload,
+    parse_company_news_payload,
+    parse_market_snapshot_payload,
+    parse_market_status_payload,
+    parse_ticker_payload,
+    rate_limit_wait_seconds,
+    rate_limited_error,
+)
+from .rate_limiter import is_background_priority
+from .settings import Settings, get_settings
+
+
+class AsyncNgxClient:
+    def __init__(self, settings: Settings | None = None) -> None:
+        self.settings = settings or get_settings()
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.settings.ngx_http_max_connections,
+                max_keepalive_connections=self.settings.ngx_http_max_keepalive_connections,
+                keepalive_expiry=self.settings.ngx_http_keepalive_expiry_seconds,
+            ),
+            follow_redirects=True,
+        )
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(max(1, self.settings.ngx_max_concurrency_per_host))
+        return slot
+
+    async def _acquire(self, endpoint: str) -> None:
+        bucket = endpoint_rate_limit(endpoint)
+        background = is_background_priority()
+        deadline = time.monotonic() + rate_limit_wait_seconds()
+        while (wait := bucket.try_acquire(background)) > 0:
+            if time.monotonic() + wait > deadline:
+                raise rate_limited_error(endpoint)
+            await asyncio.sleep(wait)
+
+    async def _get(self, endpoint: str, url: str, **kwargs: Any) -> httpx.Response:
+        await self._acquire(endpoint)
+        breaker = endpoint_circuit(endpoint)
+        if not breaker.allow():
+            raise circuit_open_error(endpoint, breaker)
+
+        try:
+            async with self._host_slot(url):
+                response = await self._client.get(url, timeout=endpoint_timeout(endpoint), **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            breaker.record(not is_upstream_failure(exc.response.status_code))
+            raise
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except BaseException:
+            breaker.record(False)
+            raise
+        breaker.record(True)
+        return response
+
+    async def _get_json(self, endpoint: str, url: str, label: str, subject: str | None = None, **kwargs: Any) -> Any:
+        suffix = f" for {subject}" if subject else ""
+        try:
+            response = await self._get(endpoint, url, **kwargs)
+            return response.json()
+        except httpx.HTTPError as exc:
+            raise NgxFetchError(f"{label} request failed{suffix}: {exc}") from exc
+        except ValueError as exc:
+            raise NgxFetchError(f"{label} response was not valid JSON{suffix}: {exc}") from exc
+
+    async def fetch_all_stocks(self) -> list[dict[str, Any]]:
+        payload = await self._get_json(
+            "ticker",
+            self.settings.ngx_ticker_url,
+            "NGX ticker",
+            params=TICKER_PARAMS,
+            headers=JSON_HEADERS,
+        )
+        return parse_ticker_payload(payload)
+
+    async def fetch_historical_prices(self, ngx_id: str) -> list[dict[str, Any]]:
+        if not ngx_id:
+            return []
+
+        payload = await self._get_json("chart", f"{self.settings.ngx_chart_base_url}{ngx_id}", "NGX chart", ngx_id)
+        return parse_chart_payload(payload, ngx_id)
+
+    async def fetch_market_status(self) -> tuple[str, Any]:
+        payload = await self._get_json(
+            "status",
+            self.settings.market_status_url,
+            "NGX market status",
+            headers=JSON_HEADERS,
+        )
+        return parse_market_status_payload(payload), payload
+
+    async def fetch_market_snapshot(self) -> dict[str, Any]:
+        payload = await self._get_json(
+            "snapshot",
+            self.settings.market_snapshot_url,
+            "NGX market snapshot",
+            headers=SNAPSHOT_HEADERS,
+        )
+        return parse_market_snapshot_payload(payload)
+
+    async def fetch_company_news(self, ngx_id: str) -> list[dict[str, Any]]:
+        if not ngx_id:
+            return []
+
+        payload = await self._get_json(
+            "news",
+            self.settings.company_news_url,
+            "NGX company news",
+            ngx_id,
+            params=company_news_params(ngx_id),
+            headers=NEWS_HEADERS,
+        )
+        return parse_company_news_payload(payload, ngx_id)
+
+    async def fetch_company_profile_html(self, symbol: str) -> str:
+        symbol = symbol.strip().upper()
+        if not symbol:
+            return ""
+
+        try:
+            response = await self._get(
+                "profile",
+                self.settings.company_profile_url,
+                params=company_profile_params(symbol),
+                headers=PROFILE_HEADERS,
+            )
+        except httpx.HTTPError as exc:
+            raise NgxFetchError(f"NGX company profile request failed for {symbol}: {exc}") from exc
+        return response.text
+
+
+_async_client: AsyncNgxClient | None = None
+
+
+def get_async_ngx_client() -> AsyncNgxClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncNgxClient()
+    return _async_client
+
+
+async def close_async_ngx_client() -> None:
+    global _async_client
+    if _async_client is None:
+        return
+    client, _async_client = _async_client, None
+    await client.aclose()
@@ -1,14 +1,22 @@
-from datetime import date, datetime
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
+from datetime import date, datetime, timezone
 from functools import lru_cache
 from html import unescape
 import re
-from threading import Lock
+from threading import BoundedSemaphore, Lock
 import time
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .cache import cache_key, ttl_cache
+from .circuit_breaker import CircuitBreaker, get_circuit_breaker
+from .rate_limiter import TokenBucket, get_token_bucket, is_background_priority
 from .settings import get_settings
 
 
@@ -16,6 +24,14 @@ class NgxFetchError(Exception):
     pass
 
 
+class NgxCircuitOpenError(NgxFetchError):
+    pass
+
+
+class NgxRateLimitedError(NgxFetchError):
+    pass
+
+
 CHART_ID_PATTERN = re.compile(r"stockchartdata/([A-Z0-9]+)")
 WEBSITE_PATTERN = re.compile(
     r"Website:\s*</td>\s*<td[^>]*>.*?<a\s+href=\"([^\"]+)\"",
@@ -24,8 +40,8 @@ WEBSITE_PATTERN = re.compile(
 
 _session: requests.Session | None = None
 _session_lock = Lock()
-_ttl_cache_store: dict[tuple[Any, ...], tuple[float, Any]] = {}
-_ttl_cache_lock = Lock()
+_host_slots: dict[str, tuple[BoundedSemaphore, BoundedSemaphore]] = {}
+_host_slots_lock = Lock()
 
 
 def _get_session() -> requests.Session:
@@ -34,32 +50,15 @@ def _get_session() -> requests.Session:
         return _session
     with _session_lock:
         if _session is None:
-            _session = requests.Session()
+            settings = get_settings()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=settings.ngx_http_max_connections)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
     return _session
 
 
-def _ttl_cache(ttl_seconds: int):
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            key = (func.__name__, args, tuple(sorted(kwargs.items())))
-            now = time.monotonic()
-            with _ttl_cache_lock:
-                cached = _ttl_cache_store.get(key)
-                if cached is not None:
-                    expires_at, value = cached
-                    if expires_at > now:
-                        return value
-                    _ttl_cache_store.pop(key, None)
-            value = func(*args, **kwargs)
-            with _ttl_cache_lock:
-                _ttl_cache_store[key] = (now + ttl_seconds, value)
-            return value
-
-        return wrapper
-
-    return decorator
-
-
 def _number(value: Any) -> float | None:
     if value is None or value == "":
         return None
@@ -82,33 +81,82 @@ def _first(item: dict[str, Any], keys: list[str]) -> Any:
     return None
 
 
-def normalize_stock(raw: dict[str, Any], source: str) -> dict[str, Any] | None:
-    symbol = _first(raw, ["SYMBOL", "symbol", "ticker", "code", "Symbol", "Ticker"])
+STOCK_FIELD_KEYS: dict[str, tuple[str, ...]] = {
+    "symbol": ("SYMBOL", "symbol", "ticker", "code", "Symbol", "Ticker"),
+    "last_price": ("Value", "last_price", "lastPrice", "price", "currentPrice", "close", "Close"),
+    "previous_close": ("previous_close", "previousClose", "pclose", "prevClose"),
+    "price_move": ("Change", "change", "PercChange", "percent_change", "changePercent", "percentageChange", "Change %"),
+    "open_price": ("Open", "open", "open_price"),
+    "high_price": ("High", "high", "high_price", "dayHigh"),
+    "low_price": ("Low", "low", "low_price", "dayLow"),
+    "ngx_id": ("ngx_id", "ngxId", "isin", "ISIN"),
+    "margin": ("margin", "spread", "Spread"),
+    "name": ("SYMBOL2", "Name", "TickerName", "name", "companyName", "company", "security", "Security"),
+    "ticker_id": ("Id", "ticker_id", "tickerId", "id", "Ticker ID"),
+    "sector": ("Sector", "sector"),
+    "volume": ("Volume", "volume"),
+    "market_cap": ("MarketCap", "market_cap", "marketCap", "Mkt Cap"),
+}
+
+
+@lru_cache(maxsize=1)
+def _stock_id_mapping() -> dict[str, str]:
+    try:
+        from config import STOCK_ID_MAPPING
+    except Exception:
+        return {}
+    return STOCK_ID_MAPPING
+
+
+def compile_stock_key_plan(keys: Iterable[Any]) -> dict[str, tuple[Any, ...]]:
+    present = set(keys)
+    lowered = {str(key).lower(): key for key in present}
+    plan: dict[str, tuple[Any, ...]] = {}
+    for field, aliases in STOCK_FIELD_KEYS.items():
+        resolved: list[Any] = []
+        for alias in aliases:
+            key = alias if alias in present else lowered.get(alias.lower())
+            if key is not None and key not in resolved:
+                resolved.append(key)
+        plan[field] = tuple(resolved)
+    return plan
+
+
+def _resolve(raw: dict[str, Any], keys: tuple[Any, ...]) -> Any:
+    for key in keys:
+        if key in raw:
+            return raw[key]
+    return None
+
+
+def normalize_stock(
+    raw: dict[str, Any],
+    source: str,
+    plan: dict[str, tuple[Any, ...]] | None = None,
+) -> dict[str, Any] | None:
+    if plan is None:
+        plan = compile_stock_key_plan(raw)
+
+    symbol = _resolve(raw, plan["symbol"])
     if not symbol:
         return None
 
     symbol_text = str(symbol).strip().upper()
-    last_price = _number(_first(raw, ["Value", "last_price", "lastPrice", "price", "currentPrice", "close", "Close"]))
-    previous_close = _number(_first(raw, ["previous_close", "previousClose", "pclose", "prevClose"]))
-    raw_price_move = _number(
-        _first(raw, ["Change", "change", "PercChange", "percent_change", "changePercent", "percentageChange", "Change %"])
-    )
-    open_price = _number(_first(raw, ["Open", "open", "open_price"]))
+    last_price = _number(_resolve(raw, plan["last_price"]))
+    previous_close = _number(_resolve(raw, plan["previous_close"]))
+    raw_price_move = _number(_resolve(raw, plan["price_move"]))
+    open_price = _number(_resolve(raw, plan["open_price"]))
     if open_price in (None, 0) and last_price is not None and raw_price_move is not None:
         derived_open = last_price - raw_price_move
         if derived_open > 0:
             open_price = derived_open
-    high_price = _number(_first(raw, ["High", "high", "high_price", "dayHigh"]))
-    low_price = _number(_first(raw, ["Low", "low", "low_price", "dayLow"]))
-    ngx_id = _first(raw, ["ngx_id", "ngxId", "isin", "ISIN"])
+    high_price = _number(_resolve(raw, plan["high_price"]))
+    low_price = _number(_resolve(raw, plan["low_price"]))
+    ngx_id = _resolve(raw, plan["ngx_id"])
     if ngx_id is None:
-        try:
-            from config import STOCK_ID_MAPPING
-        except Exception:
-            STOCK_ID_MAPPING = {}
-        ngx_id = STOCK_ID_MAPPING.get(symbol_text)
+        ngx_id = _stock_id_mapping().get(symbol_text)
 
-    margin = _number(_first(raw, ["margin", "spread", "Spread"]))
+    margin = _number(_resolve(raw, plan["margin"]))
     if margin is None and high_price is not None and low_price is not None and last_price:
         margin = ((high_price - low_price) / last_price) * 100
 
@@ -124,17 +172,17 @@ def normalize_stock(raw: dict[str, Any], source: str) -> dict[str, Any] | None:
 
     return {
         "symbol": symbol_text,
-        "name": _first(raw, ["SYMBOL2", "Name", "TickerName", "name", "companyName", "company", "security", "Security"]),
-        "ticker_id": _first(raw, ["Id", "ticker_id", "tickerId", "id", "Ticker ID"]),
+        "name": _resolve(raw, plan["name"]),
+        "ticker_id": _resolve(raw, plan["ticker_id"]),
         "ngx_id": ngx_id,
-        "sector": _first(raw, ["Sector", "sector"]),
+        "sector": _resolve(raw, plan["sector"]),
         "last_price": last_price,
         "previous_close": previous_close,
         "open_price": open_price,
         "high_price": high_price,
         "low_price": low_price,
-        "volume": _number(_first(raw, ["Volume", "volume"])),
-        "market_cap": _number(_first(raw, ["MarketCap", "market_cap", "marketCap", "Mkt Cap"])),
+        "volume": _number(_resolve(raw, plan["volume"])),
+        "market_cap": _number(_resolve(raw, plan["market_cap"])),
         "change": computed_change if computed_change is not None else raw_price_move,
         "percent_change": (
             computed_percent_change
@@ -146,46 +194,174 @@ def normalize_stock(raw: dict[str, Any], source: str) -> dict[str, Any] | None:
     }
 
 
-def fetch_all_stocks_from_ngx() -> list[dict[str, Any]]:
+def normalize_stocks(items: list[Any], source: str) -> list[dict[str, Any]]:
+    rows = [item for item in items if isinstance(item, dict)]
+    if not rows:
+        return []
+
+    plan = compile_stock_key_plan(set().union(*rows))
+    return [stock for item in rows if (stock := normalize_stock(item, source, plan))]
+
+
+TICKER_PARAMS = {"$filter": "TickerType eq 'EQUITIES'", "page_size": "1000"}
+JSON_HEADERS = {"Accept": "application/json"}
+SNAPSHOT_HEADERS = {
+    "Accept": "application/json;odata=verbose",
+    "Content-Type": "application/json;odata=verbose",
+    "Origin": "https://ngxgroup.com",
+    "Referer": "https://ngxgroup.com/exchange/data/company-profile/",
+}
+NEWS_HEADERS = {"Accept": "application/json;odata=verbose"}
+PROFILE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/124.0.0.0 Safari/537.36"
+    ),
+}
+FAVICON_URL = "https://www.google.com/s2/favicons"
+RATE_LIMIT_FAMILIES = {"status": "ticker", "snapshot": "ticker"}
+
+
+def endpoint_timeout(endpoint: str) -> float:
+    return float(getattr(get_settings(), f"ngx_{endpoint}_timeout_seconds"))
+
+
+def _host_semaphores(host: str) -> tuple[BoundedSemaphore, BoundedSemaphore]:
+    with _host_slots_lock:
+        semaphores = _host_slots.get(host)
+        if semaphores is None:
+            settings = get_settings()
+            slots = max(1, settings.ngx_max_concurrency_per_host)
+            background_slots = max(1, slots - max(0, settings.ngx_host_interactive_reserved_slots))
+            semaphores = _host_slots[host] = (BoundedSemaphore(slots), BoundedSemaphore(background_slots))
+    return semaphores
+
+
+@contextmanager
+def _host_slot(url: str) -> Iterator[None]:
+    # Background callers must also hold one of the smaller background slots, which leaves the
+    # reserved slots free for interactive requests. Both waits are bounded by the request budget.
+    host = urlparse(url).netloc.lower()
+    shared, background = _host_semaphores(host)
+    semaphores = (background, shared) if is_background_priority() else (shared,)
+    deadline = time.monotonic() + rate_limit_wait_seconds()
+    acquired: list[BoundedSemaphore] = []
+    try:
+        for semaphore in semaphores:
+            if not semaphore.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                raise NgxRateLimitedError(f"NGX host {host} has no free connection slot; try again shortly.")
+            acquired.append(semaphore)
+        yield
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+
+def endpoint_circuit(endpoint: str) -> CircuitBreaker:
+    settings = get_settings()
+    return get_circuit_breaker(
+        endpoint,
+        window_size=settings.ngx_circuit_window_size,
+        min_calls=settings.ngx_circuit_min_calls,
+        failure_rate_threshold=settings.ngx_circuit_failure_rate_threshold,
+        open_seconds=settings.ngx_circuit_open_seconds,
+        max_open_seconds=settings.ngx_circuit_max_open_seconds,
+    )
+
+
+def endpoint_rate_limit(endpoint: str) -> TokenBucket:
+    settings = get_settings()
+    family = RATE_LIMIT_FAMILIES.get(endpoint, endpoint)
+    return get_token_bucket(
+        family,
+        rate_per_second=getattr(settings, f"ngx_{family}_rate_per_second"),
+        burst=getattr(settings, f"ngx_{family}_rate_burst"),
+        background_reserve=settings.ngx_rate_limit_background_reserve,
+    )
+
+
+def rate_limit_wait_seconds() -> float:
     settings = get_settings()
+    if is_background_priority():
+        return settings.ngx_rate_limit_background_max_wait_seconds
+    return settings.ngx_rate_limit_max_wait_seconds
+
+
+def rate_limited_error(endpoint: str) -> NgxRateLimitedError:
+    return NgxRateLimitedError(f"NGX {endpoint} request budget is exhausted; try again shortly.")
+
+
+def circuit_open_error(endpoint: str, breaker: CircuitBreaker) -> NgxCircuitOpenError:
+    return NgxCircuitOpenError(
+        f"NGX {endpoint} endpoint is unavailable; skipping requests for {breaker.retry_after():.0f}s."
+    )
+
+
+def is_upstream_failure(status_code: int | None) -> bool:
+    return status_code is None or status_code >= 500 or status_code == 429
+
+
+def _get(endpoint: str, url: str, **kwargs: Any) -> requests.Response:
+    if not endpoint_rate_limit(endpoint).acquire(rate_limit_wait_seconds(), is_background_priority()):
+        raise rate_limited_error(endpoint)
+
+    with _host_slot(url):
+        breaker = endpoint_circuit(endpoint)
+        if not breaker.allow():
+            raise circuit_open_error(endpoint, breaker)
+
+        try:
+            response = _get_session().get(url, timeout=endpoint_timeout(endpoint), **kwargs)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            status_code = exc.response.status_code if exc.response is not None else None
+            breaker.record(not is_upstream_failure(status_code))
+            raise
+        except Exception:
+            breaker.record(False)
+            raise
+        except BaseException:
+            # KeyboardInterrupt/SystemExit say nothing about upstream health.
+            breaker.release()
+            raise
+    breaker.record(True)
+    return response
+
+
+def _get_json(endpoint: str, url: str, label: str, subject: str | None = None, **kwargs: Any) -> Any:
+    suffix = f" for {subject}" if subject else ""
     try:
-        response = _get_session().get(
-            settings.ngx_ticker_url,
-            params={"$filter": "TickerType eq 'EQUITIES'", "page_size": "1000"},
-            headers={"Accept": "application/json"},
-            timeout=20,
-        )
-        response.raise_for_status()
-        payload = response.json()
+        return _get(endpoint, url, **kwargs).json()
     except requests.RequestException as exc:
-        raise NgxFetchError(f"NGX ticker request failed: {exc}") from exc
+        raise NgxFetchError(f"{label} request failed{suffix}: {exc}") from exc
     except ValueError as exc:
-        raise NgxFetchError(f"NGX ticker response was not valid JSON: {exc}") from exc
+        raise NgxFetchError(f"{label} response was not valid JSON{suffix}: {exc}") from exc
+
+
+def parse_ticker_payload(payload: Any) -> list[dict[str, Any]]:
     if isinstance(payload, dict):
         payload = payload.get("data") or payload.get("stocks") or payload.get("results") or []
     if not isinstance(payload, list):
         raise NgxFetchError("NGX ticker response was not a list of equities.")
 
-    return [stock for item in payload if isinstance(item, dict) and (stock := normalize_stock(item, "ngx_doclib"))]
+    return normalize_stocks(payload, "ngx_doclib")
 
 
-@_ttl_cache(ttl_seconds=30)
-def fetch_all_stocks_from_ngx_cached() -> list[dict[str, Any]]:
-    return fetch_all_stocks_from_ngx()
+def fetch_all_stocks_from_ngx() -> list[dict[str, Any]]:
+    payload = _get_json(
+        "ticker",
+        get_settings().ngx_ticker_url,
+        "NGX ticker",
+        params=TICKER_PARAMS,
+        headers=JSON_HEADERS,
+    )
+    return parse_ticker_payload(payload)
 
 
-def fetch_historical_prices(ngx_id: str) -> list[dict[str, Any]]:
-    if not ngx_id:
-        return []
-
-    try:
-        response = _get_session().get(f"{get_settings().ngx_chart_base_url}{ngx_id}", timeout=20)
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        raise NgxFetchError(f"NGX chart request failed for {ngx_id}: {exc}") from exc
-    except ValueError as exc:
-        raise NgxFetchError(f"NGX chart response was not valid JSON for {ngx_id}: {exc}") from exc
+def parse_chart_payload(payload: Any, ngx_id: str) -> list[dict[str, Any]]:
     if not isinstance(payload, list):
         raise NgxFetchError(f"NGX chart response was not a list for {ngx_id}.")
 
@@ -212,79 +388,70 @@ def fetch_historical_prices(ngx_id: str) -> list[dict[str, Any]]:
     return rows
 
 
+def fetch_historical_prices(ngx_id: str) -> list[dict[str, Any]]:
+    if not ngx_id:
+        return []
+
+    payload = _get_json("chart", f"{get_settings().ngx_chart_base_url}{ngx_id}", "NGX chart", ngx_id)
+    return parse_chart_payload(payload, ngx_id)
+
+
+def company_profile_params(symbol: str) -> dict[str, str]:
+    return {
+        "symbol": symbol,
+        "directory": "companydirectory",
+        "tdate": datetime.now().strftime("%Y-%m-%dT00:00:00"),
+    }
+
+
 def fetch_company_profile_html(symbol: str) -> str:
     symbol = symbol.strip().upper()
     if not symbol:
         return ""
 
-    settings = get_settings()
     try:
-        response = _get_session().get(
-            settings.company_profile_url,
-            params={
-                "symbol": symbol,
-                "directory": "companydirectory",
-                "tdate": datetime.now().strftime("%Y-%m-%dT00:00:00"),
-            },
-            headers={
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/124.0.0.0 Safari/537.36"
-                ),
-            },
-            timeout=15,
+        response = _get(
+            "profile",
+            get_settings().company_profile_url,
+            params=company_profile_params(symbol),
+            headers=PROFILE_HEADERS,
         )
-        response.raise_for_status()
     except requests.RequestException as exc:
         raise NgxFetchError(f"NGX company profile request failed for {symbol}: {exc}") from exc
 
     return response.text
 
 
-@lru_cache(maxsize=512)
-def discover_stock_ngx_id(symbol: str) -> str | None:
-    html = fetch_company_profile_html(symbol)
-    match = CHART_ID_PATTERN.search(html)
-    return match.group(1) if match else None
+def parse_company_profile_html(html: str) -> dict[str, str | None]:
+    chart_match = CHART_ID_PATTERN.search(html)
+    website_match = WEBSITE_PATTERN.search(html)
+    domain: str | None = None
+    website = unescape(website_match.group(1)).strip() if website_match else ""
+    if website:
+        if not website.startswith(("http://", "https://")):
+            website = f"https://{website}"
+        domain = urlparse(website).netloc.lower().removeprefix("www.") or None
 
+    return {
+        "ngx_id": chart_match.group(1) if chart_match else None,
+        "website_domain": domain,
+    }
 
-@lru_cache(maxsize=512)
-def discover_stock_website_domain(symbol: str) -> str | None:
-    html = fetch_company_profile_html(symbol)
-    match = WEBSITE_PATTERN.search(html)
-    if not match:
-        return None
-
-    website = unescape(match.group(1)).strip()
-    if not website:
-        return None
-    if not website.startswith(("http://", "https://")):
-        website = f"https://{website}"
-
-    parsed = urlparse(website)
-    domain = parsed.netloc.lower().removeprefix("www.")
-    return domain or None
 
+def fetch_company_profile(symbol: str) -> dict[str, str | None]:
+    return parse_company_profile_html(fetch_company_profile_html(symbol))
 
-@lru_cache(maxsize=512)
-def fetch_stock_logo(symbol: str) -> tuple[bytes, str] | None:
-    domain = discover_stock_website_domain(symbol)
-    if not domain:
-        return None
 
+def fetch_website_favicon(domain: str) -> tuple[bytes, str] | None:
     try:
-        response = _get_session().get(
-            "https://www.google.com/s2/favicons",
+        response = _get(
+            "favicon",
+            FAVICON_URL,
             params={"domain": domain, "sz": "64"},
             headers={"Accept": "image/*"},
-            timeout=10,
         )
-        response.raise_for_status()
     except requests.RequestException as exc:
-        raise NgxFetchError(f"Company logo request failed for {symbol}: {exc}") from exc
+        raise NgxFetchError(f"Company logo request failed for {domain}: {exc}") from exc
 
     if not response.content:
         return None
@@ -293,20 +460,7 @@ def fetch_stock_logo(symbol: str) -> tuple[bytes, str] | None:
     return response.content, media_type or "image/png"
 
 
-def fetch_market_status_from_ngx() -> tuple[str, Any]:
-    try:
-        response = _get_session().get(
-            get_settings().market_status_url,
-            headers={"Accept": "application/json"},
-            timeout=10,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        raise NgxFetchError(f"NGX market status request failed: {exc}") from exc
-    except ValueError as exc:
-        raise NgxFetchError(f"NGX market status response was not valid JSON: {exc}") from exc
-
+def parse_market_status_payload(payload: Any) -> str:
     status = "UNKNOWN"
     if isinstance(payload, list) and payload:
         first = payload[0]
@@ -314,27 +468,15 @@ def fetch_market_status_from_ngx() -> tuple[str, Any]:
             status = str(first.get("MktStatus1") or first.get("status") or first.get("Status") or status)
     elif isinstance(payload, dict):
         status = str(payload.get("MktStatus1") or payload.get("status") or payload.get("Status") or status)
-    return status, payload
+    return status
 
 
-def fetch_market_snapshot_from_ngx() -> dict[str, Any]:
-    try:
-        response = _get_session().get(
-            get_settings().market_snapshot_url,
-            headers={
-                "Accept": "application/json;odata=verbose",
-                "Content-Type": "application/json;odata=verbose",
-                "Origin": "https://ngxgroup.com",
-                "Referer": "https://ngxgroup.com/exchange/data/company-profile/",
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        raise NgxFetchError(f"NGX market snapshot request failed: {exc}") from exc
-    except ValueError as exc:
-        raise NgxFetchError(f"NGX market snapshot response was not valid JSON: {exc}") from exc
+def fetch_market_status_from_ngx() -> tuple[str, Any]:
+    payload = _get_json("status", get_settings().market_status_url, "NGX market status", headers=JSON_HEADERS)
+    return parse_market_status_payload(payload), payload
+
+
+def parse_market_snapshot_payload(payload: Any) -> dict[str, Any]:
     if not isinstance(payload, dict):
         raise NgxFetchError("NGX market snapshot response was not an object.")
 
@@ -350,35 +492,40 @@ def fetch_market_snapshot_from_ngx() -> dict[str, Any]:
     }
 
 
-def fetch_company_news_from_ngx(ngx_id: str) -> list[dict[str, Any]]:
-    if not ngx_id:
-        return []
+def fetch_market_snapshot_from_ngx() -> dict[str, Any]:
+    payload = _get_json("snapshot", get_settings().market_snapshot_url, "NGX market snapshot", headers=SNAPSHOT_HEADERS)
+    return parse_market_snapshot_payload(payload)
 
-    settings = get_settings()
-    params = {
-        "$select": "URL,Modified,InternationSecIN,Type_of_Submission",
+
+NEWS_SUBMISSION_FILTER = (
+    "(Type_of_Submission eq 'Corporate Actions' or "
+    "Type_of_Submission eq 'Corporate Disclosures' or "
+    "substringof('Meeting' ,Type_of_Submission))"
+)
+NEWS_SELECT = "Id,URL,Modified,InternationSecIN,Type_of_Submission"
+NEWS_PAGE_SIZE = 100
+NEWS_INGEST_PAGE_SIZE = 500
+
+
+def company_news_params(ngx_id: str) -> dict[str, str]:
+    return {
+        "$select": NEWS_SELECT,
         "$orderby": "Modified desc",
-        "$filter": (
-            f"InternationSecIN eq '{ngx_id}' and "
-            "(Type_of_Submission eq 'Corporate Actions' or "
-            "Type_of_Submission eq 'Corporate Disclosures' or "
-            "substringof('Meeting' ,Type_of_Submission))"
-        ),
+        "$filter": f"InternationSecIN eq '{ngx_id}' and {NEWS_SUBMISSION_FILTER}",
     }
-    try:
-        response = _get_session().get(
-            settings.company_news_url,
-            params=params,
-            headers={"Accept": "application/json;odata=verbose"},
-            timeout=15,
-        )
-        response.raise_for_status()
-        payload = response.json()
-    except requests.RequestException as exc:
-        raise NgxFetchError(f"NGX company news request failed for {ngx_id}: {exc}") from exc
-    except ValueError as exc:
-        raise NgxFetchError(f"NGX company news response was not valid JSON for {ngx_id}: {exc}") from exc
 
+
+def company_news_batch_params(ngx_ids: list[str]) -> dict[str, str]:
+    ids_filter = " or ".join(f"InternationSecIN eq '{ngx_id}'" for ngx_id in ngx_ids)
+    return {
+        "$select": NEWS_SELECT,
+        "$orderby": "Modified desc",
+        "$filter": f"({ids_filter}) and {NEWS_SUBMISSION_FILTER}",
+        "$top": str(NEWS_PAGE_SIZE * len(ngx_ids)),
+    }
+
+
+def parse_company_news_payload(payload: Any, ngx_id: str) -> list[dict[str, Any]]:
     results: Any = payload
     if isinstance(payload, dict):
         results = payload.get("d", {}).get("results", [])
@@ -394,6 +541,7 @@ def fetch_company_news_from_ngx(ngx_id: str) -> list[dict[str, Any]]:
             url_info = {}
         items.append(
             {
+                "item_id": item.get("Id"),
                 "title": url_info.get("Description"),
                 "url": url_info.get("Url"),
                 "modified": item.get("Modified"),
@@ -404,43 +552,157 @@ def fetch_company_news_from_ngx(ngx_id: str) -> list[dict[str, Any]]:
     return items
 
 
-@_ttl_cache(ttl_seconds=60)
+def parse_company_news_batch_payload(payload: Any, ngx_ids: list[str]) -> list[dict[str, Any]]:
+    # Items without InternationSecIN fall back to the joined subject, which only names a real id for
+    # single-id batches; keep just the items attributed to a requested id.
+    requested = set(ngx_ids)
+    return [item for item in parse_company_news_payload(payload, ", ".join(ngx_ids)) if item["ngx_id"] in requested]
+
+
+def fetch_company_news_from_ngx(ngx_id: str) -> list[dict[str, Any]]:
+    if not ngx_id:
+        return []
+
+    payload = _get_json(
+        "news",
+        get_settings().company_news_url,
+        "NGX company news",
+        ngx_id,
+        params=company_news_params(ngx_id),
+        headers=NEWS_HEADERS,
+    )
+    return parse_company_news_payload(payload, ngx_id)
+
+
+def fetch_company_news_batch_from_ngx(ngx_ids: list[str]) -> tuple[dict[str, list[dict[str, Any]]], bool]:
+    payload = _get_json(
+        "news",
+        get_settings().company_news_url,
+        "NGX company news",
+        ", ".join(ngx_ids),
+        params=company_news_batch_params(ngx_ids),
+        headers=NEWS_HEADERS,
+    )
+    items = parse_company_news_payload(payload, ", ".join(ngx_ids))
+    grouped: dict[str, list[dict[str, Any]]] = {ngx_id: [] for ngx_id in ngx_ids}
+    for item in items:
+        if item["ngx_id"] in grouped:
+            grouped[item["ngx_id"]].append(item)
+    return grouped, len(items) >= NEWS_PAGE_SIZE * len(ngx_ids)
+
+
+def company_news_since_params(ngx_ids: list[str], modified_after: datetime | None) -> dict[str, str]:
+    ids_filter = " or ".join(f"InternationSecIN eq '{ngx_id}'" for ngx_id in ngx_ids)
+    news_filter = f"({ids_filter}) and {NEWS_SUBMISSION_FILTER}"
+    if modified_after is not None:
+        news_filter = f"{news_filter} and Modified ge datetime'{modified_after.astimezone(timezone.utc):%Y-%m-%dT%H:%M:%SZ}'"
+    return {
+        "$select": NEWS_SELECT,
+        "$orderby": "Modified asc",
+        "$filter": news_filter,
+        "$top": str(NEWS_INGEST_PAGE_SIZE),
+    }
+
+
+def fetch_company_news_since(
+    ngx_ids: list[str],
+    modified_after: datetime | None,
+    max_pages: int = 20,
+) -> list[dict[str, Any]]:
+    subject = ", ".join(ngx_ids)
+    url = get_settings().company_news_url
+    params: dict[str, str] | None = company_news_since_params(ngx_ids, modified_after)
+    items: list[dict[str, Any]] = []
+    for _ in range(max(1, max_pages)):
+        payload = _get_json("news", url, "NGX company news", subject, params=params, headers=NEWS_HEADERS)
+        items.extend(parse_company_news_batch_payload(payload, ngx_ids))
+        next_url = payload.get("d", {}).get("__next") if isinstance(payload, dict) else None
+        if not next_url:
+            break
+        url, params = next_url, None
+    return items
+
+
+def _stale_ttl_seconds() -> int:
+    return get_settings().ngx_cache_stale_ttl_seconds
+
+
+@ttl_cache(ttl_seconds=60, maxsize=1, stale_ttl_seconds=_stale_ttl_seconds)
 def fetch_market_snapshot_cached() -> dict[str, Any]:
     return fetch_market_snapshot_from_ngx()
 
 
-@_ttl_cache(ttl_seconds=300)
+@ttl_cache(ttl_seconds=300, maxsize=256, stale_ttl_seconds=_stale_ttl_seconds)
 def fetch_company_news_cached(ngx_id: str) -> list[dict[str, Any]]:
     return fetch_company_news_from_ngx(ngx_id)
 
 
-@_ttl_cache(ttl_seconds=900)
+def fetch_company_news_batch(
+    ngx_ids: Iterable[str],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[str, NgxFetchError]]:
+    news: dict[str, list[dict[str, Any]]] = {}
+    errors: dict[str, NgxFetchError] = {}
+    cache = fetch_company_news_cached.cache
+    missing: list[str] = []
+    for ngx_id in dict.fromkeys(ngx_id for ngx_id in ngx_ids if ngx_id):
+        cached = cache.get(cache_key(ngx_id), None)
+        if cached is None:
+            missing.append(ngx_id)
+        else:
+            news[ngx_id] = cached
+
+    batch_size = max(1, get_settings().ngx_news_batch_size)
+    for start in range(0, len(missing), batch_size):
+        chunk = missing[start : start + batch_size]
+        try:
+            grouped, truncated = fetch_company_news_batch_from_ngx(chunk)
+        except NgxFetchError as exc:
+            errors.update(dict.fromkeys(chunk, exc))
+            continue
+
+        for ngx_id, items in grouped.items():
+            # A truncated page only proves completeness for ids that filled a whole single-id page.
+            if not truncated or len(items) >= NEWS_PAGE_SIZE:
+                news[ngx_id] = items[:NEWS_PAGE_SIZE]
+                cache.set(cache_key(ngx_id), news[ngx_id])
+                continue
+            try:
+                news[ngx_id] = fetch_company_news_cached(ngx_id)
+            except NgxFetchError as exc:
+                errors[ngx_id] = exc
+    return news, errors
+
+
+# Every caller writes these rows and stamps StockHistorySyncState.last_fetched_at, so this cache never
+# serves stale entries: a stale chart would be written as fresh and its background refresh dropped.
+@ttl_cache(ttl_seconds=900, maxsize=256)
 def fetch_historical_prices_cached(ngx_id: str) -> list[dict[str, Any]]:
     return fetch_historical_prices(ngx_id)
 
 
 def legacy_seed_stocks() -> list[dict[str, Any]]:
-    try:
-        from config import STOCK_ID_MAPPING
-    except Exception:
-        STOCK_ID_MAPPING = {}
+    mapping = _stock_id_mapping()
+    workers = max(1, min(get_settings().stock_history_sync_workers, len(mapping) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="legacy-seed") as executor:
+        futures = {
+            symbol: executor.submit(copy_context().run, fetch_historical_prices_cached, ngx_id)
+            for symbol, ngx_id in mapping.items()
+        }
 
     stocks = []
-    for symbol, ngx_id in STOCK_ID_MAPPING.items():
-        last_price = None
+    for symbol, ngx_id in mapping.items():
         try:
-            history = fetch_historical_prices(ngx_id)
+            history = futures[symbol].result()
         except NgxFetchError:
             history = []
-        if history:
-            last_price = history[-1]["close_price"]
         stocks.append(
             {
                 "symbol": symbol.upper(),
                 "name": symbol.upper(),
                 "ngx_id": ngx_id,
-                "last_price": last_price,
+                "last_price": history[-1]["close_price"] if history else None,
                 "source": "legacy_stock_mapping",
+                "history": history,
             }
         )
     return stocks
@@ -0,0 +1,66 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+import time
+
+
+_background_priority: ContextVar[bool] = ContextVar("ngx_background_priority", default=False)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    token = _background_priority.set(True)
+    try:
+        yield
+    finally:
+        _background_priority.reset(token)
+
+
+def is_background_priority() -> bool:
+    return _background_priority.get()
+
+
+class TokenBucket:
+    def __init__(self, name: str, rate_per_second: float, burst: float, background_reserve: float = 0.5) -> None:
+        self.name = name
+        self.rate_per_second = max(0.001, rate_per_second)
+        self.burst = max(1.0, burst)
+        self.reserved_tokens = min(self.burst - 1, max(0.0, background_reserve) * self.burst)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def try_acquire(self, background: bool = False) -> float:
+        # Background callers leave reserved_tokens in the bucket for interactive requests.
+        floor = self.reserved_tokens if background else 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            if self._tokens - floor >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (floor + 1 - self._tokens) / self.rate_per_second
+
+    def acquire(self, max_wait_seconds: float, background: bool = False) -> bool:
+        deadline = time.monotonic() + max_wait_seconds
+        while True:
+            wait = self.try_acquire(background)
+            if wait <= 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = Lock()
+
+
+def get_token_bucket(name: str, rate_per_second: float, burst: float, background_reserve: float = 0.5) -> TokenBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = _buckets[name] = TokenBucket(name, rate_per_second, burst, background_reserve)
+        return bucket
@@ -1,6 +1,7 @@
 from datetime import date, datetime
+import json
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 
 class RegisterRequest(BaseModel):
@@ -146,12 +147,34 @@ class SyncLogOut(BaseModel):
     status: str
     source: str
     stocks_upserted: int
+    stocks_changed: int = 0
+    stocks_unchanged: int = 0
     history_rows_upserted: int
     message: str | None = None
+    stage_timings: dict[str, float] | None = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("stage_timings", mode="before")
+    @classmethod
+    def parse_stage_timings(cls, value: object) -> object:
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
+
+class CircuitBreakerOut(BaseModel):
+    name: str
+    state: str
+    failure_rate: float = 0
+    calls: int = 0
+    trips: int = 0
+    rejected: int = 0
+    open_seconds: float = 0
+    opened_at: datetime | None = None
+    retry_at: datetime | None = None
+
 
 class SyncStatusOut(BaseModel):
     status: str
@@ -160,6 +183,24 @@ class SyncStatusOut(BaseModel):
     last_success_at: datetime | None = None
     last_attempt_at: datetime | None = None
     stocks_count: int = 0
+    circuits: list[CircuitBreakerOut] = []
+
+
+class CacheStatsOut(BaseModel):
+    name: str
+    ttl_seconds: float
+    stale_ttl_seconds: float = 0
+    maxsize: int
+    size: int = 0
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    coalesced: int = 0
+    inflight: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
 
 
 class MarketStatusOut(BaseModel):
@@ -187,6 +228,11 @@ class CompanyNewsOut(BaseModel):
     modified: datetime | None = None
     ngx_id: str | None = None
     submission_type: str | None = None
+    financial_statement: bool = False
+
+
+class CompanyNewsSearchOut(CompanyNewsOut):
+    symbol: str | None = None
 
 
 class StockDetailOut(BaseModel):
@@ -197,6 +243,8 @@ class StockDetailOut(BaseModel):
 
 
 class MarketLeadersOut(BaseModel):
+    generation: int = 0
+    window: str = "1d"
     top_movers: list[StockOut]
     top_losers: list[StockOut]
 
@@ -214,6 +262,7 @@ class MarketIdeaOut(BaseModel):
 
 
 class MarketIdeasOut(BaseModel):
+    generation: int = 0
     disclaimer: str
     generated_at: datetime | None = None
     stocks_analyzed: int = 0
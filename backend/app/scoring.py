@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+IDEA_COLUMNS = ("last_price", "open_price", "previous_close", "volume", "market_cap", "margin")
+
+
+@dataclass(frozen=True)
+class IdeaScores:
+    symbols: np.ndarray
+    eligible: np.ndarray
+    intraday_change: np.ndarray
+    volume_score: np.ndarray
+    market_cap_score: np.ndarray
+    margin: np.ndarray
+    margin_score: np.ndarray
+    close_strength: np.ndarray
+    one_year_growth_percent: np.ndarray
+    score: np.ndarray
+
+
+def _column(values: Sequence[Any]) -> np.ndarray:
+    # None (and Numeric/Decimal) convert directly; missing values become NaN.
+    return np.array(values, dtype=float)
+
+
+def percentile_ranks(values: np.ndarray) -> np.ndarray:
+    # Share of the positive reference values that are <= each value, from one sort.
+    present = np.isfinite(values)
+    reference = np.sort(values[present & (values > 0)])
+    ranks = np.zeros(values.shape, dtype=float)
+    if reference.size:
+        ranks[present] = np.searchsorted(reference, values[present], side="right") / reference.size
+    return ranks
+
+
+def score_universe(
+    symbols: Sequence[str],
+    columns: dict[str, Sequence[Any]],
+    close_ranges: dict[str, tuple[float, float]],
+) -> IdeaScores:
+    last_price = _column(columns["last_price"])
+    open_price = _column(columns["open_price"])
+    previous_close = _column(columns["previous_close"])
+    margin = _column(columns["margin"])
+    first_close = _column([close_ranges.get(symbol, (None, None))[0] for symbol in symbols])
+    last_close = _column([close_ranges.get(symbol, (None, None))[1] for symbol in symbols])
+
+    eligible = np.isfinite(last_price) & np.isfinite(open_price) & (open_price > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intraday_change = np.where(eligible, (last_price - open_price) / open_price * 100, np.nan)
+        growth = np.where(first_close > 0, (last_close - first_close) / first_close * 100, np.nan)
+
+    volume_score = percentile_ranks(_column(columns["volume"]))
+    market_cap_score = percentile_ranks(_column(columns["market_cap"]))
+    margin_score = np.where(np.isfinite(margin), np.maximum(0.0, 1.0 - np.minimum(margin, 10.0) / 10.0), 0.0)
+    close_strength = (last_price > previous_close).astype(float)
+
+    score = np.clip(intraday_change, 0.0, 10.0) * 4.0
+    score += volume_score * 25.0
+    score += market_cap_score * 15.0
+    score += margin_score * 10.0
+    score += close_strength * 10.0
+    score += np.where(np.isfinite(growth), np.clip(growth, -10.0, 40.0) * 0.7, 0.0)
+
+    return IdeaScores(
+        symbols=np.array(symbols, dtype=str),
+        eligible=eligible,
+        intraday_change=intraday_change,
+        volume_score=volume_score,
+        market_cap_score=market_cap_score,
+        margin=margin,
+        margin_score=margin_score,
+        close_strength=close_strength,
+        one_year_growth_percent=growth,
+        score=score,
+    )
+
+
+def top_ideas(scores: IdeaScores, count: int) -> list[int]:
+    # Same order as sorting (round(score, 2), symbol) descending over the eligible stocks.
+    indices = np.flatnonzero(scores.eligible)
+    order = np.lexsort((scores.symbols[indices], np.round(scores.score[indices], 2)))[::-1]
+    return indices[order[:count]].tolist()
+
+
+def idea_metrics(scores: IdeaScores, index: int) -> dict[str, float | None]:
+    metrics: dict[str, float | None] = {}
+    for name in (
+        "intraday_change",
+        "volume_score",
+        "market_cap_score",
+        "margin",
+        "close_strength",
+        "one_year_growth_percent",
+        "score",
+    ):
+        value = float(getattr(scores, name)[index])
+        metrics[name] = None if np.isnan(value) else value
+    return metrics
@@ -1,34 +1,242 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+import hashlib
 import json
-from datetime import date
-
-from sqlalchemy import delete, func, select
+import re
+from datetime import date, datetime, timedelta, timezone
+import time
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import (
+    Date,
+    String,
+    and_,
+    case,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    table,
+    text,
+    true,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from .models import MarketStatus, PortfolioAlertState, PortfolioHolding, Stock, StockPrice, SyncLog, User
+from .circuit_breaker import circuit_breaker_states
+from .models import (
+    FINANCIAL_STATEMENT_PATTERN,
+    CompanyNews,
+    MarketStatus,
+    PortfolioAlertState,
+    PortfolioHolding,
+    Stock,
+    StockHistorySyncState,
+    StockPrice,
+    StockProfile,
+    StockReturn,
+    SyncLog,
+    User,
+)
 from .ngx_client import (
     NgxFetchError,
     fetch_all_stocks_from_ngx,
+    fetch_company_news_cached,
+    fetch_company_news_since,
+    fetch_company_profile,
     fetch_historical_prices_cached,
     fetch_market_status_from_ngx,
     legacy_seed_stocks,
 )
 from .schemas import HoldingUpsert
+from .settings import get_settings
+
+
+STOCK_SYNC_FIELDS = (
+    "name",
+    "ticker_id",
+    "ngx_id",
+    "sector",
+    "last_price",
+    "previous_close",
+    "open_price",
+    "high_price",
+    "low_price",
+    "volume",
+    "market_cap",
+    "change",
+    "percent_change",
+    "margin",
+    "source",
+)
+STOCK_TEXT_FIELDS = {"name", "ticker_id", "ngx_id", "sector", "source"}
+# 17 bind parameters per row; 1000-row chunks stay well under Postgres' 65535 parameter limit.
+STOCK_UPSERT_CHUNK = 1000
 
 
-def upsert_stock(db: Session, stock_data: dict) -> Stock:
-    stock = db.get(Stock, stock_data["symbol"])
-    if stock is None:
-        stock = Stock(symbol=stock_data["symbol"])
-        db.add(stock)
+def _stock_row(stock_data: dict) -> dict:
+    row = {"symbol": stock_data["symbol"]}
+    for field in STOCK_SYNC_FIELDS:
+        value = stock_data.get(field)
+        row[field] = str(value) if value is not None and field in STOCK_TEXT_FIELDS else value
+    return row
+
+
+def stock_row_fingerprint(row: dict) -> str:
+    payload = json.dumps([row.get(field) for field in STOCK_SYNC_FIELDS], default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def bulk_upsert_stocks(db: Session, stocks: list[dict]) -> tuple[list[str], list[str]]:
+    rows: dict[str, dict] = {}
+    for stock_data in stocks:
+        row = _stock_row(stock_data)
+        existing = rows.get(row["symbol"])
+        if existing is None:
+            rows[row["symbol"]] = row
+        else:
+            existing.update({field: value for field, value in row.items() if value is not None})
+    if not rows:
+        return [], []
+    for row in rows.values():
+        row["row_fingerprint"] = stock_row_fingerprint(row)
+
+    values = list(rows.values())
+    changed: list[str] = []
+    for start in range(0, len(values), STOCK_UPSERT_CHUNK):
+        base_insert = insert(Stock).values(values[start : start + STOCK_UPSERT_CHUNK])
+        stmt = base_insert.on_conflict_do_update(
+            index_elements=[Stock.symbol],
+            set_={
+                **{
+                    field: func.coalesce(base_insert.excluded[field], Stock.__table__.c[field])
+                    for field in STOCK_SYNC_FIELDS
+                },
+                "row_fingerprint": base_insert.excluded.row_fingerprint,
+                "updated_at": func.now(),
+            },
+            where=Stock.row_fingerprint.is_distinct_from(base_insert.excluded.row_fingerprint),
+        ).returning(Stock.symbol)
+        changed.extend(db.scalars(stmt).all())
+    return list(rows), changed
+
+
+def rank_intraday_leaders(db: Session) -> int:
+    # One window pass over the universe; rank 1 is the best intraday mover, ties broken by symbol.
+    eligible = and_(Stock.last_price.is_not(None), Stock.open_price > 0)
+    change = Stock.last_price - Stock.open_price
+    percent_change = change / func.nullif(Stock.open_price, 0) * 100
+    rank = func.row_number().over(partition_by=eligible, order_by=(percent_change.desc(), Stock.symbol.desc()))
+    ranked = select(
+        Stock.symbol,
+        case((eligible, change)).label("change"),
+        case((eligible, func.round(percent_change, 4))).label("percent_change"),
+        case((eligible, rank)).label("rank"),
+    ).subquery()
+    stmt = (
+        update(Stock)
+        .where(
+            Stock.symbol == ranked.c.symbol,
+            or_(
+                Stock.intraday_change.is_distinct_from(ranked.c.change),
+                Stock.intraday_percent_change.is_distinct_from(ranked.c.percent_change),
+                Stock.intraday_rank.is_distinct_from(ranked.c.rank),
+            ),
+        )
+        # Ranks are derived data; leave updated_at tracking the last price change.
+        .values(
+            intraday_change=ranked.c.change,
+            intraday_percent_change=ranked.c.percent_change,
+            intraday_rank=ranked.c.rank,
+            updated_at=Stock.updated_at,
+        )
+    )
+    return db.execute(stmt).rowcount or 0
+
+
+STOCK_RETURN_PERIODS = ("1w", "1m", "3m", "ytd", "1y")
 
-    for field, value in stock_data.items():
-        if hasattr(stock, field) and value is not None:
-            setattr(stock, field, value)
-    return stock
+
+def stock_return_period_starts(today: date) -> dict[str, date]:
+    return {
+        "1w": today - timedelta(days=7),
+        "1m": today - relativedelta(months=1),
+        "3m": today - relativedelta(months=3),
+        "ytd": date(today.year, 1, 1),
+        "1y": today - relativedelta(years=1),
+    }
+
+
+def refresh_stock_returns(db: Session, today: date | None = None) -> int:
+    # One set-based pass: per symbol, a LIMIT 1 probe for the latest close and one per period for
+    # the last close on or before the period start, both on uq_stock_prices_symbol_date.
+    # Symbols without history reaching back to the period start get no row for that period.
+    periods = values(column("period", String), column("since", Date), name="periods").data(
+        list(stock_return_period_starts(today or date.today()).items())
+    )
+    latest = (
+        select(StockPrice.trade_date, StockPrice.close_price)
+        .where(StockPrice.stock_symbol == Stock.symbol)
+        .order_by(StockPrice.trade_date.desc())
+        .limit(1)
+        .lateral("latest_price")
+    )
+    start = (
+        select(StockPrice.trade_date, StockPrice.close_price)
+        .where(StockPrice.stock_symbol == Stock.symbol, StockPrice.trade_date <= periods.c.since)
+        .order_by(StockPrice.trade_date.desc())
+        .limit(1)
+        .lateral("start_price")
+    )
+    change = latest.c.close_price - start.c.close_price
+    percent_change = change / start.c.close_price * 100
+    rank = func.row_number().over(partition_by=periods.c.period, order_by=(percent_change.desc(), Stock.symbol.desc()))
+    rows = (
+        select(
+            Stock.symbol,
+            periods.c.period,
+            start.c.trade_date,
+            start.c.close_price,
+            latest.c.trade_date,
+            latest.c.close_price,
+            change,
+            func.round(percent_change, 4),
+            rank,
+        )
+        .select_from(Stock)
+        .join(latest, true())
+        .join(periods, true())
+        .join(start, true())
+        .where(start.c.close_price > 0)
+    )
+    # The table is small and fully derived, so it is rebuilt inside the sync transaction.
+    db.execute(delete(StockReturn))
+    stmt = insert(StockReturn).from_select(
+        [
+            "stock_symbol",
+            "period",
+            "start_date",
+            "start_close",
+            "end_date",
+            "end_close",
+            "change",
+            "percent_change",
+            "rank",
+        ],
+        rows,
+    )
+    return db.execute(stmt).rowcount or 0
 
 
 STALE_DATA_MESSAGE = "Issue with NGX server. Current data might not be up to date."
+HISTORY_COPY_THRESHOLD = 200
+COMPANY_NEWS_INSERT_CHUNK = 1000
+STOCK_PRICE_COPY_COLUMNS = ("stock_symbol", "trade_date", "open_price", "high_price", "low_price", "close_price", "volume")
+stock_prices_staging = table("stock_prices_staging", *(column(name) for name in STOCK_PRICE_COPY_COLUMNS))
 
 
 def record_sync_log(
@@ -37,24 +245,36 @@ def record_sync_log(
     status: str,
     source: str,
     stocks_upserted: int = 0,
+    stocks_changed: int = 0,
+    stocks_unchanged: int = 0,
     history_rows_upserted: int = 0,
     message: str | None = None,
+    stage_timings: dict[str, float] | None = None,
 ) -> SyncLog:
     log = SyncLog(
         status=status,
         source=source,
         stocks_upserted=stocks_upserted,
+        stocks_changed=stocks_changed,
+        stocks_unchanged=stocks_unchanged,
         history_rows_upserted=history_rows_upserted,
         message=message,
+        stage_timings=json.dumps(stage_timings) if stage_timings else None,
     )
     db.add(log)
     return log
 
 
-def sync_stocks(db: Session, include_history: bool = False) -> tuple[str, int, int, str, str | None]:
+def sync_stocks(
+    db: Session,
+    include_history: bool = False,
+    prefetched_stocks: list[dict] | None = None,
+) -> tuple[str, int, int, str, str | None]:
     source = "ngx_doclib"
+    started_at = time.perf_counter()
+    timings: dict[str, float] = {}
     try:
-        stocks = fetch_all_stocks_from_ngx()
+        stocks = prefetched_stocks if prefetched_stocks is not None else fetch_all_stocks_from_ngx()
     except NgxFetchError as exc:
         existing_count = db.scalar(select(func.count()).select_from(Stock)) or 0
         message = f"{STALE_DATA_MESSAGE} {exc}"
@@ -76,24 +296,82 @@ def sync_stocks(db: Session, include_history: bool = False) -> tuple[str, int, i
             db.commit()
             return "database_cache", 0, 0, "warning", message
 
-    history_count = 0
-    for stock_data in stocks:
-        stock = upsert_stock(db, stock_data)
-        if include_history and stock.ngx_id:
-            history_count += upsert_stock_history(db, stock.symbol, stock.ngx_id)
-        history_count += upsert_daily_stock_snapshot(db, stock)
+    # The legacy seed already fetched full chart history; keep it instead of fetching it again.
+    seeded_histories: dict[str, list[dict]] = {}
+    for stock in stocks:
+        history = stock.pop("history", None)
+        if history:
+            seeded_histories[stock["symbol"]] = history
+    timings["fetch_stocks"] = time.perf_counter() - started_at
+
+    stage_started_at = time.perf_counter()
+    symbols, changed_symbols = bulk_upsert_stocks(db, stocks)
+    timings["upsert_stocks"] = time.perf_counter() - stage_started_at
 
+    stage_started_at = time.perf_counter()
+    rank_intraday_leaders(db)
+    timings["rank_leaders"] = time.perf_counter() - stage_started_at
+
+    # Discovery commits the upsert so far; running it before history lets new chart ids get history now.
+    stage_started_at = time.perf_counter()
+    discover_stock_ngx_ids(db)
+    timings["discover_ngx_ids"] = time.perf_counter() - stage_started_at
+
+    history_count = 0
+    if include_history or seeded_histories:
+        stage_started_at = time.perf_counter()
+        histories, errors = dict(seeded_histories), {}
+        if include_history:
+            targets = db.execute(
+                select(Stock.symbol, Stock.ngx_id).where(Stock.symbol.in_(symbols), Stock.ngx_id.is_not(None))
+            ).all()
+            fetched, errors = fetch_stock_histories(
+                [(symbol, ngx_id) for symbol, ngx_id in targets if symbol not in seeded_histories]
+            )
+            histories.update(fetched)
+        timings["fetch_history"] = time.perf_counter() - stage_started_at
+
+        stage_started_at = time.perf_counter()
+        for exc in errors.values():
+            record_history_fetch_warning(db, exc)
+        for symbol, rows in histories.items():
+            history_count += write_stock_history(db, symbol, rows)
+        timings["write_history"] = time.perf_counter() - stage_started_at
+
+    stage_started_at = time.perf_counter()
+    history_count += bulk_upsert_daily_stock_snapshots(db, symbols)
+    timings["write_snapshots"] = time.perf_counter() - stage_started_at
+
+    stage_started_at = time.perf_counter()
+    refresh_stock_returns(db)
+    timings["rank_returns"] = time.perf_counter() - stage_started_at
+
+    stage_started_at = time.perf_counter()
+    sync_company_news(db)
+    timings["sync_news"] = time.perf_counter() - stage_started_at
+
+    # The success log is the sync generation bump, so it is written only after every stage that feeds
+    # the cached leaders and ideas payloads (stocks, ranks, ngx_ids, returns and news) has committed.
+    timings["total"] = time.perf_counter() - started_at
     record_sync_log(
         db,
         status="success",
         source=source,
         stocks_upserted=len(stocks),
+        stocks_changed=len(changed_symbols),
+        stocks_unchanged=len(symbols) - len(changed_symbols),
         history_rows_upserted=history_count,
+        stage_timings={stage: round(seconds, 3) for stage, seconds in timings.items()},
     )
     db.commit()
     return source, len(stocks), history_count, "success", None
 
 
+def sync_generation(db: Session) -> int:
+    # Each successful sync pass ends with a new success log, so its id doubles as a data generation.
+    return db.scalar(select(func.max(SyncLog.id)).where(SyncLog.status == "success")) or 0
+
+
 def sync_status(db: Session) -> dict:
     last_attempt = db.scalar(select(SyncLog).order_by(SyncLog.created_at.desc(), SyncLog.id.desc()).limit(1))
     last_success = db.scalar(
@@ -109,6 +387,7 @@ def sync_status(db: Session) -> dict:
         "last_success_at": last_success.created_at if last_success else None,
         "last_attempt_at": last_attempt.created_at if last_attempt else None,
         "stocks_count": stocks_count,
+        "circuits": circuit_breaker_states(),
     }
 
 
@@ -163,55 +442,265 @@ def get_cached_market_status(db: Session) -> dict:
     return market_status_to_dict(cached, stale=bool(cached.message))
 
 
-def upsert_stock_history(db: Session, symbol: str, ngx_id: str) -> int:
+def stock_profile_is_due(profile: StockProfile) -> bool:
+    if profile.fetched_at is None:
+        return True
+
+    settings = get_settings()
+    fetched_at = profile.fetched_at
+    if fetched_at.tzinfo is None:
+        fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+    complete = profile.ngx_id is not None and profile.website_domain is not None
+    ttl = settings.stock_profile_ttl_seconds if complete else settings.stock_profile_negative_ttl_seconds
+    return datetime.now(timezone.utc) - fetched_at > timedelta(seconds=max(0, ttl))
+
+
+def get_stock_profile(db: Session, symbol: str) -> StockProfile | None:
+    symbol = symbol.strip().upper()
+    if not symbol:
+        return None
+
+    profile = db.get(StockProfile, symbol)
+    if profile is not None and not stock_profile_is_due(profile):
+        return profile
+
     try:
-        rows = fetch_historical_prices_cached(ngx_id)
-    except NgxFetchError as exc:
+        data = fetch_company_profile(symbol)
+    except NgxFetchError:
+        if profile is not None:
+            return profile
+        raise
+
+    # Upsert so concurrent first lookups of a symbol do not race on the primary key; the caller commits.
+    upsert_stock_profiles(db, {symbol: data})
+    return db.get(StockProfile, symbol, populate_existing=True)
+
+
+def upsert_stock_profiles(db: Session, profiles: dict[str, dict]) -> None:
+    if not profiles:
+        return
+
+    fetched_at = datetime.now(timezone.utc)
+    base_insert = insert(StockProfile).values(
+        [
+            {
+                "symbol": symbol,
+                "ngx_id": data["ngx_id"],
+                "website_domain": data["website_domain"],
+                "fetched_at": fetched_at,
+            }
+            for symbol, data in profiles.items()
+        ]
+    )
+    db.execute(
+        base_insert.on_conflict_do_update(
+            index_elements=[StockProfile.symbol],
+            set_={
+                "ngx_id": base_insert.excluded.ngx_id,
+                "website_domain": base_insert.excluded.website_domain,
+                "fetched_at": base_insert.excluded.fetched_at,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+def fetch_concurrently(
+    fetch,
+    targets: dict[str, str],
+    workers: int,
+    thread_name_prefix: str,
+) -> tuple[dict, dict[str, NgxFetchError]]:
+    results: dict = {}
+    errors: dict[str, NgxFetchError] = {}
+    if not targets:
+        return results, errors
+
+    workers = max(1, min(workers, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        futures = {key: executor.submit(copy_context().run, fetch, argument) for key, argument in targets.items()}
+        for key, future in futures.items():
+            try:
+                results[key] = future.result()
+            except NgxFetchError as exc:
+                errors[key] = exc
+    return results, errors
+
+
+def fetch_stock_histories(
+    targets: list[tuple[str, str]],
+) -> tuple[dict[str, list[dict]], dict[str, NgxFetchError]]:
+    return fetch_concurrently(
+        fetch_historical_prices_cached,
+        dict(targets),
+        get_settings().stock_history_sync_workers,
+        "history-sync",
+    )
+
+
+def discover_stock_ngx_ids(db: Session) -> int:
+    symbols = list(db.scalars(select(Stock.symbol).where(Stock.ngx_id.is_(None))).all())
+    if not symbols:
+        return 0
+
+    profiles = {
+        profile.symbol: profile for profile in db.scalars(select(StockProfile).where(StockProfile.symbol.in_(symbols)))
+    }
+    targets = {
+        symbol: symbol for symbol in symbols if symbol not in profiles or stock_profile_is_due(profiles[symbol])
+    }
+    fetched, errors = fetch_concurrently(
+        fetch_company_profile,
+        targets,
+        get_settings().stock_discovery_workers,
+        "ngx-id-discovery",
+    )
+
+    upsert_stock_profiles(db, fetched)
+
+    discovered = db.execute(
+        update(Stock)
+        .where(
+            Stock.symbol == StockProfile.symbol,
+            Stock.symbol.in_(symbols),
+            Stock.ngx_id.is_(None),
+            StockProfile.ngx_id.is_not(None),
+        )
+        .values(ngx_id=StockProfile.ngx_id, updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    ).rowcount or 0
+    if errors:
         record_sync_log(
             db,
             status="warning",
-            source="ngx_chart",
-            message=f"{STALE_DATA_MESSAGE} {exc}",
+            source="ngx_profile",
+            message=f"{STALE_DATA_MESSAGE} {len(errors)} profile lookup(s) failed: {next(iter(errors.values()))}",
         )
-        return 0
+    db.commit()
+    return discovered
 
-    count = 0
-    for row in rows:
-        base_insert = insert(StockPrice).values(stock_symbol=symbol, **row)
-        stmt = base_insert.on_conflict_do_update(
-            constraint="uq_stock_prices_symbol_date",
-            set_={
-                "close_price": base_insert.excluded.close_price,
-                "open_price": base_insert.excluded.open_price,
-                "high_price": base_insert.excluded.high_price,
-                "low_price": base_insert.excluded.low_price,
-                "volume": base_insert.excluded.volume,
-                "updated_at": func.now(),
-            },
-        )
-        db.execute(stmt)
-        count += 1
-    return count
+
+def record_history_fetch_warning(db: Session, exc: NgxFetchError) -> None:
+    record_sync_log(
+        db,
+        status="warning",
+        source="ngx_chart",
+        message=f"{STALE_DATA_MESSAGE} {exc}",
+    )
 
 
-def upsert_daily_stock_snapshot(db: Session, stock: Stock) -> int:
-    if stock.last_price is None:
+def upsert_stock_history(db: Session, symbol: str, ngx_id: str) -> int:
+    try:
+        rows = fetch_historical_prices_cached(ngx_id)
+    except NgxFetchError as exc:
+        record_history_fetch_warning(db, exc)
         return 0
+    return write_stock_history(db, symbol, rows)
+
+
+def write_stock_history(db: Session, symbol: str, rows: list[dict]) -> int:
+    # Charts can carry several points per day; keep the last one, as a single upsert can touch a row only once.
+    rows = list({row["trade_date"]: row for row in rows}.values())
+    state = db.get(StockHistorySyncState, symbol)
+    if state is None:
+        state = StockHistorySyncState(stock_symbol=symbol)
+        db.add(state)
+    elif state.last_trade_date is not None:
+        overlap_start = state.last_trade_date - timedelta(days=max(0, get_settings().stock_history_overlap_days))
+        rows = [row for row in rows if row["trade_date"] >= overlap_start]
+
+    if rows:
+        latest_trade_date = max(row["trade_date"] for row in rows)
+        if state.last_trade_date is None or latest_trade_date > state.last_trade_date:
+            state.last_trade_date = latest_trade_date
+    state.last_fetched_at = datetime.now(timezone.utc)
+
+    price_rows = [{"stock_symbol": symbol, **row} for row in rows]
+    if len(price_rows) >= HISTORY_COPY_THRESHOLD:
+        return copy_stock_price_rows(db, price_rows)
+    return insert_stock_price_rows(db, price_rows)
+
+
+def _stock_price_conflict_update(base_insert) -> dict:
+    return {
+        "close_price": base_insert.excluded.close_price,
+        "open_price": base_insert.excluded.open_price,
+        "high_price": base_insert.excluded.high_price,
+        "low_price": base_insert.excluded.low_price,
+        "volume": base_insert.excluded.volume,
+        "updated_at": func.now(),
+    }
 
-    snapshot_close = float(stock.last_price)
-    snapshot_open = float(stock.open_price or stock.previous_close or stock.last_price)
-    snapshot_high = float(stock.high_price) if stock.high_price is not None else snapshot_close
-    snapshot_low = float(stock.low_price) if stock.low_price is not None else snapshot_close
-    snapshot_volume = float(stock.volume) if stock.volume is not None else None
+
+def insert_stock_price_rows(db: Session, rows: list[dict]) -> int:
+    if not rows:
+        return 0
 
     base_insert = insert(StockPrice).values(
-        stock_symbol=stock.symbol,
-        trade_date=date.today(),
-        open_price=snapshot_open,
-        high_price=snapshot_high,
-        low_price=snapshot_low,
-        close_price=snapshot_close,
-        volume=snapshot_volume,
+        [{name: row.get(name) for name in STOCK_PRICE_COPY_COLUMNS} for row in rows]
+    )
+    stmt = base_insert.on_conflict_do_update(
+        constraint="uq_stock_prices_symbol_date",
+        set_=_stock_price_conflict_update(base_insert),
+    )
+    db.execute(stmt)
+    return len(rows)
+
+
+def copy_stock_price_rows(db: Session, rows: list[dict]) -> int:
+    if not rows:
+        return 0
+
+    db.execute(
+        text(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS stock_prices_staging (
+                stock_symbol VARCHAR(32) NOT NULL,
+                trade_date DATE NOT NULL,
+                open_price NUMERIC(18, 4),
+                high_price NUMERIC(18, 4),
+                low_price NUMERIC(18, 4),
+                close_price NUMERIC(18, 4) NOT NULL,
+                volume NUMERIC(20, 2)
+            ) ON COMMIT DELETE ROWS
+            """
+        )
+    )
+    db.execute(text("TRUNCATE stock_prices_staging"))
+    with db.connection().connection.cursor() as cursor:
+        with cursor.copy(f"COPY stock_prices_staging ({', '.join(STOCK_PRICE_COPY_COLUMNS)}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(tuple(row.get(name) for name in STOCK_PRICE_COPY_COLUMNS))
+
+    base_insert = insert(StockPrice).from_select(
+        list(STOCK_PRICE_COPY_COLUMNS),
+        select(*(stock_prices_staging.c[name] for name in STOCK_PRICE_COPY_COLUMNS))
+        .distinct(stock_prices_staging.c.stock_symbol, stock_prices_staging.c.trade_date)
+        .order_by(stock_prices_staging.c.stock_symbol, stock_prices_staging.c.trade_date),
+    )
+    stmt = base_insert.on_conflict_do_update(
+        constraint="uq_stock_prices_symbol_date",
+        set_=_stock_price_conflict_update(base_insert),
+    )
+    return db.execute(stmt).rowcount or 0
+
+
+def bulk_upsert_daily_stock_snapshots(db: Session, symbols: list[str]) -> int:
+    if not symbols:
+        return 0
+
+    snapshot_rows = select(
+        Stock.symbol,
+        literal(date.today()),
+        func.coalesce(func.nullif(Stock.open_price, 0), func.nullif(Stock.previous_close, 0), Stock.last_price),
+        func.coalesce(Stock.high_price, Stock.last_price),
+        func.coalesce(Stock.low_price, Stock.last_price),
+        Stock.last_price,
+        Stock.volume,
+    ).where(Stock.symbol.in_(symbols), Stock.last_price.is_not(None))
+    base_insert = insert(StockPrice).from_select(
+        ["stock_symbol", "trade_date", "open_price", "high_price", "low_price", "close_price", "volume"],
+        snapshot_rows,
     )
     stmt = base_insert.on_conflict_do_update(
         constraint="uq_stock_prices_symbol_date",
@@ -223,9 +712,161 @@ def upsert_daily_stock_snapshot(db: Session, stock: Stock) -> int:
             "volume": base_insert.excluded.volume,
             "updated_at": func.now(),
         },
+        where=or_(
+            *(
+                StockPrice.__table__.c[name].is_distinct_from(base_insert.excluded[name])
+                for name in ("open_price", "high_price", "low_price", "close_price", "volume")
+            )
+        ),
     )
-    db.execute(stmt)
-    return 1
+    return db.execute(stmt).rowcount or 0
+
+
+def _news_modified(value) -> datetime | None:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def upsert_company_news(db: Session, items: list[dict]) -> int:
+    rows: dict[int, dict] = {}
+    for item in items:
+        if item.get("item_id") is None or not item.get("ngx_id"):
+            continue
+        rows[int(item["item_id"])] = {
+            "item_id": int(item["item_id"]),
+            "ngx_id": str(item["ngx_id"]),
+            "title": item.get("title"),
+            "url": item.get("url"),
+            "submission_type": item.get("submission_type"),
+            "modified": _news_modified(item.get("modified")),
+        }
+
+    values = list(rows.values())
+    upserted = 0
+    for start in range(0, len(values), COMPANY_NEWS_INSERT_CHUNK):
+        base_insert = insert(CompanyNews).values(values[start : start + COMPANY_NEWS_INSERT_CHUNK])
+        stmt = base_insert.on_conflict_do_update(
+            index_elements=[CompanyNews.item_id],
+            set_={
+                "ngx_id": base_insert.excluded.ngx_id,
+                "title": base_insert.excluded.title,
+                "url": base_insert.excluded.url,
+                "submission_type": base_insert.excluded.submission_type,
+                "modified": base_insert.excluded.modified,
+                "updated_at": func.now(),
+            },
+            where=CompanyNews.modified.is_distinct_from(base_insert.excluded.modified),
+        )
+        upserted += db.execute(stmt).rowcount or 0
+    return upserted
+
+
+def sync_company_news(db: Session) -> int:
+    settings = get_settings()
+    ngx_ids = list(db.scalars(select(Stock.ngx_id).where(Stock.ngx_id.is_not(None)).distinct()).all())
+    watermarks: dict[str, datetime | None] = dict(
+        db.execute(select(CompanyNews.ngx_id, func.max(CompanyNews.modified)).group_by(CompanyNews.ngx_id)).all()
+    )
+    # Ids with similar watermarks share a chunk, so each query's lower bound stays tight.
+    ngx_ids.sort(key=lambda ngx_id: (watermarks.get(ngx_id) is not None, watermarks.get(ngx_id) or datetime.min))
+
+    batch_size = max(1, settings.ngx_news_batch_size)
+    upserted = 0
+    errors: list[NgxFetchError] = []
+    for start in range(0, len(ngx_ids), batch_size):
+        chunk = ngx_ids[start : start + batch_size]
+        chunk_watermarks = [watermarks.get(ngx_id) for ngx_id in chunk]
+        modified_after = None if None in chunk_watermarks else min(chunk_watermarks)
+        try:
+            items = fetch_company_news_since(chunk, modified_after, settings.company_news_sync_max_pages)
+        except NgxFetchError as exc:
+            errors.append(exc)
+            continue
+        upserted += upsert_company_news(db, items)
+        db.commit()
+
+    if errors:
+        record_sync_log(
+            db,
+            status="warning",
+            source="ngx_news",
+            message=f"{STALE_DATA_MESSAGE} {len(errors)} news batch(es) failed: {errors[0]}",
+        )
+        db.commit()
+    return upserted
+
+
+def is_financial_statement_title(title: str | None) -> bool:
+    return bool(re.search(FINANCIAL_STATEMENT_PATTERN, (title or "").lower()))
+
+
+def company_news_to_dict(news: CompanyNews) -> dict:
+    return {
+        "title": news.title,
+        "url": news.url,
+        "modified": news.modified,
+        "ngx_id": news.ngx_id,
+        "submission_type": news.submission_type,
+        "financial_statement": bool(news.is_financial_statement),
+    }
+
+
+def live_company_news(items: list[dict]) -> list[dict]:
+    return [{**item, "financial_statement": is_financial_statement_title(item.get("title"))} for item in items]
+
+
+def company_news_query(db: Session, ngx_id: str, limit: int) -> list[dict]:
+    rows = db.scalars(
+        select(CompanyNews)
+        .where(CompanyNews.ngx_id == ngx_id)
+        .order_by(CompanyNews.modified.desc().nulls_last())
+        .limit(limit)
+    ).all()
+    if rows:
+        return [company_news_to_dict(row) for row in rows]
+    return live_company_news(fetch_company_news_cached(ngx_id)[:limit])
+
+
+def latest_company_news(db: Session, ngx_ids: list[str]) -> dict[str, dict]:
+    if not ngx_ids:
+        return {}
+
+    rows = db.scalars(
+        select(CompanyNews)
+        .where(CompanyNews.ngx_id.in_(ngx_ids))
+        .distinct(CompanyNews.ngx_id)
+        .order_by(CompanyNews.ngx_id, CompanyNews.modified.desc().nulls_last())
+    ).all()
+    return {row.ngx_id: company_news_to_dict(row) for row in rows}
+
+
+def search_company_news(
+    db: Session,
+    query: str,
+    limit: int,
+    symbol: str | None = None,
+    financial_only: bool = False,
+) -> list[dict]:
+    ts_query = func.websearch_to_tsquery("english", query)
+    news_symbol = (
+        select(Stock.symbol).where(Stock.ngx_id == CompanyNews.ngx_id).order_by(Stock.symbol).limit(1).scalar_subquery()
+    )
+    stmt = select(CompanyNews, news_symbol).where(CompanyNews.search_vector.bool_op("@@")(ts_query))
+    if symbol:
+        stmt = stmt.where(CompanyNews.ngx_id.in_(select(Stock.ngx_id).where(Stock.symbol == symbol.strip().upper())))
+    if financial_only:
+        stmt = stmt.where(CompanyNews.is_financial_statement.is_(True))
+    stmt = stmt.order_by(
+        CompanyNews.modified.desc().nulls_last(),
+        func.ts_rank(CompanyNews.search_vector, ts_query).desc(),
+    ).limit(limit)
+    return [{**company_news_to_dict(news), "symbol": stock_symbol} for news, stock_symbol in db.execute(stmt).all()]
 
 
 def holding_to_dict(holding: PortfolioHolding) -> dict:
@@ -260,9 +901,11 @@ def upsert_holding(db: Session, user: User, payload: HoldingUpsert) -> Portfolio
 
     if payload.manual_name:
         stock.name = payload.manual_name
+        stock.row_fingerprint = None
     if payload.manual_current_price is not None:
         stock.last_price = payload.manual_current_price
         stock.source = "manual"
+        stock.row_fingerprint = None
 
     holding = db.scalar(
         select(PortfolioHolding).where(PortfolioHolding.user_id == user.id, PortfolioHolding.stock_symbol == symbol)
@@ -307,3 +950,24 @@ def stock_history_query(db: Session, symbol: str, since: date):
         .unique()
         .all()
     )
+
+
+def _close_probe(since: date, newest: bool):
+    return (
+        select(StockPrice.close_price)
+        .where(StockPrice.stock_symbol == Stock.symbol, StockPrice.trade_date >= since)
+        .order_by(StockPrice.trade_date.desc() if newest else StockPrice.trade_date)
+        .limit(1)
+        .correlate(Stock)
+        .scalar_subquery()
+    )
+
+
+def stock_close_range_since(db: Session, since: date) -> dict[str, tuple[float, float]]:
+    # Two LIMIT 1 probes per symbol on uq_stock_prices_symbol_date instead of scanning a year of rows.
+    rows = db.execute(select(Stock.symbol, _close_probe(since, False), _close_probe(since, True))).all()
+    return {
+        symbol: (float(first_close), float(last_close))
+        for symbol, first_close, last_close in rows
+        if first_close is not None and last_close is not None
+    }
@@ -40,8 +40,65 @@ class Settings(BaseSettings):
         default="https://ngxgroup.com/exchange/data/company-profile/",
         validation_alias="COMPANY_PROFILE_URL",
     )
+    ngx_http_max_connections: int = Field(default=20, validation_alias="NGX_HTTP_MAX_CONNECTIONS")
+    ngx_http_max_keepalive_connections: int = Field(default=10, validation_alias="NGX_HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    ngx_http_keepalive_expiry_seconds: float = Field(default=30.0, validation_alias="NGX_HTTP_KEEPALIVE_EXPIRY_SECONDS")
+    ngx_max_concurrency_per_host: int = Field(default=6, validation_alias="NGX_MAX_CONCURRENCY_PER_HOST")
+    ngx_host_interactive_reserved_slots: int = Field(
+        default=2,
+        validation_alias="NGX_HOST_INTERACTIVE_RESERVED_SLOTS",
+    )
+    ngx_ticker_timeout_seconds: float = Field(default=20.0, validation_alias="NGX_TICKER_TIMEOUT_SECONDS")
+    ngx_chart_timeout_seconds: float = Field(default=20.0, validation_alias="NGX_CHART_TIMEOUT_SECONDS")
+    ngx_status_timeout_seconds: float = Field(default=10.0, validation_alias="NGX_STATUS_TIMEOUT_SECONDS")
+    ngx_snapshot_timeout_seconds: float = Field(default=10.0, validation_alias="NGX_SNAPSHOT_TIMEOUT_SECONDS")
+    ngx_news_timeout_seconds: float = Field(default=15.0, validation_alias="NGX_NEWS_TIMEOUT_SECONDS")
+    ngx_profile_timeout_seconds: float = Field(default=15.0, validation_alias="NGX_PROFILE_TIMEOUT_SECONDS")
+    ngx_favicon_timeout_seconds: float = Field(default=10.0, validation_alias="NGX_FAVICON_TIMEOUT_SECONDS")
+    ngx_ticker_rate_per_second: float = Field(default=2.0, validation_alias="NGX_TICKER_RATE_PER_SECOND")
+    ngx_ticker_rate_burst: int = Field(default=5, validation_alias="NGX_TICKER_RATE_BURST")
+    ngx_chart_rate_per_second: float = Field(default=5.0, validation_alias="NGX_CHART_RATE_PER_SECOND")
+    ngx_chart_rate_burst: int = Field(default=10, validation_alias="NGX_CHART_RATE_BURST")
+    ngx_news_rate_per_second: float = Field(default=2.0, validation_alias="NGX_NEWS_RATE_PER_SECOND")
+    ngx_news_rate_burst: int = Field(default=5, validation_alias="NGX_NEWS_RATE_BURST")
+    ngx_profile_rate_per_second: float = Field(default=1.0, validation_alias="NGX_PROFILE_RATE_PER_SECOND")
+    ngx_profile_rate_burst: int = Field(default=3, validation_alias="NGX_PROFILE_RATE_BURST")
+    ngx_favicon_rate_per_second: float = Field(default=5.0, validation_alias="NGX_FAVICON_RATE_PER_SECOND")
+    ngx_favicon_rate_burst: int = Field(default=10, validation_alias="NGX_FAVICON_RATE_BURST")
+    ngx_rate_limit_background_reserve: float = Field(default=0.5, validation_alias="NGX_RATE_LIMIT_BACKGROUND_RESERVE")
+    ngx_rate_limit_max_wait_seconds: float = Field(default=5.0, validation_alias="NGX_RATE_LIMIT_MAX_WAIT_SECONDS")
+    ngx_rate_limit_background_max_wait_seconds: float = Field(
+        default=120.0,
+        validation_alias="NGX_RATE_LIMIT_BACKGROUND_MAX_WAIT_SECONDS",
+    )
+    ngx_news_batch_size: int = Field(default=10, validation_alias="NGX_NEWS_BATCH_SIZE")
+    ngx_circuit_window_size: int = Field(default=20, validation_alias="NGX_CIRCUIT_WINDOW_SIZE")
+    ngx_circuit_min_calls: int = Field(default=5, validation_alias="NGX_CIRCUIT_MIN_CALLS")
+    ngx_circuit_failure_rate_threshold: float = Field(
+        default=0.5,
+        validation_alias="NGX_CIRCUIT_FAILURE_RATE_THRESHOLD",
+    )
+    ngx_circuit_open_seconds: float = Field(default=15.0, validation_alias="NGX_CIRCUIT_OPEN_SECONDS")
+    ngx_circuit_max_open_seconds: float = Field(default=300.0, validation_alias="NGX_CIRCUIT_MAX_OPEN_SECONDS")
+    ngx_cache_stale_ttl_seconds: int = Field(default=60 * 60, validation_alias="NGX_CACHE_STALE_TTL_SECONDS")
+    stock_profile_ttl_seconds: int = Field(default=30 * 24 * 60 * 60, validation_alias="STOCK_PROFILE_TTL_SECONDS")
+    stock_profile_negative_ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        validation_alias="STOCK_PROFILE_NEGATIVE_TTL_SECONDS",
+    )
+    market_payload_cache_ttl_seconds: int = Field(default=15 * 60, validation_alias="MARKET_PAYLOAD_CACHE_TTL_SECONDS")
+    logo_cache_dir: str = Field(default=".cache/logos", validation_alias="LOGO_CACHE_DIR")
+    logo_cache_ttl_seconds: int = Field(default=7 * 24 * 60 * 60, validation_alias="LOGO_CACHE_TTL_SECONDS")
+    logo_cache_negative_ttl_seconds: int = Field(
+        default=24 * 60 * 60,
+        validation_alias="LOGO_CACHE_NEGATIVE_TTL_SECONDS",
+    )
     enable_background_stock_sync: bool = Field(default=True, validation_alias="ENABLE_BACKGROUND_STOCK_SYNC")
     stock_sync_interval_seconds: int = Field(default=15 * 60, validation_alias="STOCK_SYNC_INTERVAL_SECONDS")
+    stock_history_sync_workers: int = Field(default=8, validation_alias="STOCK_HISTORY_SYNC_WORKERS")
+    stock_history_overlap_days: int = Field(default=3, validation_alias="STOCK_HISTORY_OVERLAP_DAYS")
+    stock_discovery_workers: int = Field(default=4, validation_alias="STOCK_DISCOVERY_WORKERS")
+    company_news_sync_max_pages: int = Field(default=20, validation_alias="COMPANY_NEWS_SYNC_MAX_PAGES")
     frontend_base_url: str = Field(default="http://localhost:8080", validation_alias="FRONTEND_BASE_URL")
     support_email: str | None = Field(default=None, validation_alias="SUPPORT_EMAIL")
     smtp_host: str | None = Field(default=None, validation_alias="SMTP_HOST")
@@ -1,11 +1,14 @@
 from .database import SessionLocal
+from .rate_limiter import background_priority
 from .services import sync_stocks
 
 
 def main() -> None:
-    with SessionLocal() as db:
-        source, stock_count, history_count = sync_stocks(db, include_history=True)
-        print(f"Synced {stock_count} stocks and {history_count} history rows from {source}.")
+    with background_priority(), SessionLocal() as db:
+        source, stock_count, history_count, status, message = sync_stocks(db, include_history=True)
+        print(f"Synced {stock_count} stocks and {history_count} history rows from {source} ({status}).")
+        if message:
+            print(message)
 
 
 if __name__ == "__main__":
@@ -24,7 +24,11 @@ CREATE TABLE IF NOT EXISTS stocks (
     change NUMERIC(18, 4),
     percent_change NUMERIC(10, 4),
     margin NUMERIC(10, 4),
+    intraday_change NUMERIC(18, 4),
+    intraday_percent_change NUMERIC(10, 4),
+    intraday_rank INTEGER,
     source VARCHAR(64),
+    row_fingerprint VARCHAR(64),
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
@@ -43,6 +47,38 @@ CREATE TABLE IF NOT EXISTS stock_prices (
     CONSTRAINT uq_stock_prices_symbol_date UNIQUE (stock_symbol, trade_date)
 );
 
+CREATE TABLE IF NOT EXISTS stock_profiles (
+    symbol VARCHAR(32) PRIMARY KEY,
+    ngx_id VARCHAR(64),
+    website_domain VARCHAR(255),
+    fetched_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS stock_returns (
+    stock_symbol VARCHAR(32) NOT NULL REFERENCES stocks(symbol) ON DELETE CASCADE,
+    period VARCHAR(8) NOT NULL,
+    start_date DATE NOT NULL,
+    start_close NUMERIC(18, 4) NOT NULL,
+    end_date DATE NOT NULL,
+    end_close NUMERIC(18, 4) NOT NULL,
+    change NUMERIC(18, 4) NOT NULL,
+    percent_change NUMERIC(12, 4) NOT NULL,
+    rank INTEGER NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (stock_symbol, period)
+);
+
+CREATE TABLE IF NOT EXISTS stock_history_sync_state (
+    stock_symbol VARCHAR(32) PRIMARY KEY REFERENCES stocks(symbol) ON DELETE CASCADE,
+    last_trade_date DATE,
+    last_fetched_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 CREATE TABLE IF NOT EXISTS portfolio_holdings (
     id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
     user_id BIGINT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
@@ -55,13 +91,33 @@ CREATE TABLE IF NOT EXISTS portfolio_holdings (
     CONSTRAINT uq_portfolio_user_stock UNIQUE (user_id, stock_symbol)
 );
 
+CREATE TABLE IF NOT EXISTS company_news (
+    item_id BIGINT PRIMARY KEY,
+    ngx_id VARCHAR(64) NOT NULL,
+    title TEXT,
+    url TEXT,
+    submission_type VARCHAR(128),
+    modified TIMESTAMPTZ,
+    is_financial_statement BOOLEAN GENERATED ALWAYS AS (
+        coalesce(lower(title), '') ~ '(audited|annual report|financial statement|q[1-4])'
+    ) STORED,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(title, '') || ' ' || coalesce(submission_type, ''))
+    ) STORED,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
 CREATE TABLE IF NOT EXISTS sync_logs (
     id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
     status VARCHAR(32) NOT NULL,
     source VARCHAR(64) NOT NULL,
     stocks_upserted INTEGER NOT NULL DEFAULT 0,
+    stocks_changed INTEGER NOT NULL DEFAULT 0,
+    stocks_unchanged INTEGER NOT NULL DEFAULT 0,
     history_rows_upserted INTEGER NOT NULL DEFAULT 0,
     message TEXT,
+    stage_timings TEXT,
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
@@ -78,7 +134,12 @@ CREATE TABLE IF NOT EXISTS market_status (
 
 CREATE INDEX IF NOT EXISTS ix_stocks_ticker_id ON stocks(ticker_id);
 CREATE INDEX IF NOT EXISTS ix_stocks_ngx_id ON stocks(ngx_id);
+CREATE INDEX IF NOT EXISTS ix_stocks_intraday_rank ON stocks(intraday_rank);
 CREATE INDEX IF NOT EXISTS ix_stock_prices_symbol_date ON stock_prices(stock_symbol, trade_date);
+CREATE INDEX IF NOT EXISTS ix_stock_profiles_fetched_at ON stock_profiles(fetched_at);
+CREATE INDEX IF NOT EXISTS ix_stock_returns_period_rank ON stock_returns(period, rank);
+CREATE INDEX IF NOT EXISTS ix_company_news_ngx_id_modified ON company_news(ngx_id, modified);
+CREATE INDEX IF NOT EXISTS ix_company_news_search_vector ON company_news USING GIN (search_vector);
 CREATE INDEX IF NOT EXISTS ix_portfolio_holdings_user_id ON portfolio_holdings(user_id);
 CREATE INDEX IF NOT EXISTS ix_sync_logs_status ON sync_logs(status);
 CREATE INDEX IF NOT EXISTS ix_sync_logs_source ON sync_logs(source);
@@ -903,9 +903,12 @@ class ApiClient {
     );
   }
 
-  Future<MarketLeaders> marketLeaders({int limit = 5}) async {
+  Future<MarketLeaders> marketLeaders({
+    int limit = 5,
+    String window = '1d',
+  }) async {
     final response = await _client.get(
-      _uri('/market/leaders', {'limit': '$limit'}),
+      _uri('/market/leaders', {'limit': '$limit', 'window': window}),
       headers: _headers,
     );
     _expect(response, 200);
@@ -914,9 +917,12 @@ class ApiClient {
     );
   }
 
-  Future<MarketLeaders> publicMarketLeaders({int limit = 6}) async {
+  Future<MarketLeaders> publicMarketLeaders({
+    int limit = 6,
+    String window = '1d',
+  }) async {
     final response = await _client.get(
-      _uri('/public/market/leaders', {'limit': '$limit'}),
+      _uri('/public/market/leaders', {'limit': '$limit', 'window': window}),
     );
     _expect(response, 200);
     return MarketLeaders.fromJson(
@@ -1388,15 +1394,21 @@ class MarketSnapshot {
 }
 
 class MarketLeaders {
-  MarketLeaders({required this.topMovers, required this.topLosers});
+  MarketLeaders({
+    required this.topMovers,
+    required this.topLosers,
+    this.window = '1d',
+  });
 
   final List<Stock> topMovers;
   final List<Stock> topLosers;
+  final String window;
 
   factory MarketLeaders.fromJson(Map<String, dynamic> json) {
     final movers = json['top_movers'] as List<dynamic>? ?? const [];
     final losers = json['top_losers'] as List<dynamic>? ?? const [];
     return MarketLeaders(
+      window: json['window'] as String? ?? '1d',
       topMovers: movers
           .map((item) => Stock.fromJson(item as Map<String, dynamic>))
           .toList(),
@@ -0,0 +1,89 @@
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+import random
+import sys
+import time
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import func  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert  # noqa: E402
+
+from backend.app.database import SessionLocal  # noqa: E402
+from backend.app.models import Stock, StockPrice  # noqa: E402
+from backend.app.services import copy_stock_price_rows  # noqa: E402
+
+
+BENCHMARK_SYMBOL = "ZZBENCHLOAD"
+
+
+def synthetic_history(days: int) -> list[dict]:
+    rng = random.Random(7)
+    start = date.today() - timedelta(days=days)
+    price = 25.0
+    rows = []
+    previous_close = None
+    for offset in range(days):
+        price = max(0.5, price * (1 + rng.uniform(-0.03, 0.03)))
+        close_price = round(price, 4)
+        rows.append(
+            {
+                "stock_symbol": BENCHMARK_SYMBOL,
+                "trade_date": start + timedelta(days=offset),
+                "open_price": previous_close if previous_close is not None else close_price,
+                "close_price": close_price,
+            }
+        )
+        previous_close = close_price
+    return rows
+
+
+def load_with_row_loop(db, rows: list[dict]) -> int:
+    for row in rows:
+        base_insert = insert(StockPrice).values(**row)
+        stmt = base_insert.on_conflict_do_update(
+            constraint="uq_stock_prices_symbol_date",
+            set_={
+                "close_price": base_insert.excluded.close_price,
+                "open_price": base_insert.excluded.open_price,
+                "high_price": base_insert.excluded.high_price,
+                "low_price": base_insert.excluded.low_price,
+                "volume": base_insert.excluded.volume,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+    return len(rows)
+
+
+def run(label: str, loader, rows: list[dict], repeat: int) -> None:
+    timings = []
+    for _ in range(repeat):
+        with SessionLocal() as db:
+            db.add(Stock(symbol=BENCHMARK_SYMBOL, name="Benchmark", source="benchmark"))
+            db.flush()
+            started_at = time.perf_counter()
+            loader(db, rows)
+            db.flush()
+            timings.append(time.perf_counter() - started_at)
+            db.rollback()
+    best = min(timings)
+    print(f"{label:<12} {len(rows):>7} rows  best {best:8.3f}s  {len(rows) / best:12,.0f} rows/sec")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the per-row stock_prices upsert loop with the COPY loader.")
+    parser.add_argument("--days", type=int, default=3650, help="Synthetic history length per run.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = synthetic_history(args.days)
+    run("row loop", load_with_row_loop, rows, args.repeat)
+    run("copy merge", copy_stock_price_rows, rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
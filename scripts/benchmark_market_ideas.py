@@ -0,0 +1,129 @@
+import argparse
+from pathlib import Path
+import random
+import sys
+import timeit
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.app.scoring import IDEA_COLUMNS, score_universe, top_ideas  # noqa: E402
+
+
+def _percentile(sorted_values: list[float], value: float | None) -> float:
+    if value is None or not sorted_values:
+        return 0.0
+    less_or_equal = 0
+    for candidate in sorted_values:
+        if candidate <= value:
+            less_or_equal += 1
+    return less_or_equal / len(sorted_values)
+
+
+def legacy_rank_ideas(
+    stocks: list[dict[str, Any]],
+    close_ranges: dict[str, tuple[float, float]],
+    count: int,
+) -> list[tuple[float, str]]:
+    volumes = sorted(float(stock["volume"]) for stock in stocks if stock["volume"] is not None and stock["volume"] > 0)
+    market_caps = sorted(
+        float(stock["market_cap"]) for stock in stocks if stock["market_cap"] is not None and stock["market_cap"] > 0
+    )
+
+    candidates: list[tuple[float, str]] = []
+    for stock in stocks:
+        current_price = stock["last_price"]
+        opening_price = stock["open_price"]
+        if current_price is None or opening_price is None or opening_price <= 0:
+            continue
+
+        intraday_change = ((current_price - opening_price) / opening_price) * 100
+        volume_score = _percentile(volumes, stock["volume"])
+        market_cap_score = _percentile(market_caps, stock["market_cap"])
+        margin_value = stock["margin"]
+        margin_score = 0.0 if margin_value is None else max(0.0, 1.0 - min(margin_value, 10.0) / 10.0)
+        close_strength = 0.0
+        if stock["previous_close"] is not None and current_price > stock["previous_close"]:
+            close_strength = 1.0
+        growth_tuple = close_ranges.get(stock["symbol"])
+        one_year_growth_percent: float | None = None
+        if growth_tuple is not None and growth_tuple[0] > 0:
+            one_year_growth_percent = ((growth_tuple[1] - growth_tuple[0]) / growth_tuple[0]) * 100
+
+        score = max(0.0, min(intraday_change, 10.0)) * 4.0
+        score += volume_score * 25.0
+        score += market_cap_score * 15.0
+        score += margin_score * 10.0
+        score += close_strength * 10.0
+        if one_year_growth_percent is not None:
+            score += max(-10.0, min(one_year_growth_percent, 40.0)) * 0.7
+        candidates.append((round(score, 2), stock["symbol"]))
+
+    candidates.sort(reverse=True)
+    return candidates[:count]
+
+
+def generated_universe(symbols: int) -> tuple[list[dict[str, Any]], dict[str, tuple[float, float]]]:
+    rng = random.Random(42)
+    stocks = []
+    close_ranges = {}
+    for index in range(symbols):
+        symbol = f"SYM{index:05d}"
+        open_price = round(rng.uniform(0.5, 2000), 2)
+        last_price = round(open_price * rng.uniform(0.9, 1.1), 2)
+        stocks.append(
+            {
+                "symbol": symbol,
+                "last_price": last_price,
+                "open_price": open_price,
+                "previous_close": round(open_price * rng.uniform(0.95, 1.05), 2),
+                "volume": float(rng.randint(0, 50_000_000)) if rng.random() > 0.05 else None,
+                "market_cap": round(rng.uniform(1e8, 5e12), 2) if rng.random() > 0.1 else None,
+                "margin": round(rng.uniform(0, 15), 4) if rng.random() > 0.2 else None,
+            }
+        )
+        if rng.random() > 0.3:
+            close_ranges[symbol] = (round(rng.uniform(0.5, 2000), 2), last_price)
+    return stocks, close_ranges
+
+
+def vectorized_rank_ideas(
+    stocks: list[dict[str, Any]],
+    close_ranges: dict[str, tuple[float, float]],
+    count: int,
+) -> list[tuple[float, str]]:
+    symbols = [stock["symbol"] for stock in stocks]
+    scores = score_universe(
+        symbols,
+        {column: [stock[column] for stock in stocks] for column in IDEA_COLUMNS},
+        close_ranges,
+    )
+    return [(round(float(scores.score[index]), 2), symbols[index]) for index in top_ideas(scores, count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the legacy and vectorized market ideas scoring.")
+    parser.add_argument("--symbols", type=int, default=10_000, help="Synthetic universe size.")
+    parser.add_argument("--count", type=int, default=20, help="Shortlist size to compare.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stocks, close_ranges = generated_universe(args.symbols)
+    if legacy_rank_ideas(stocks, close_ranges, args.count) != vectorized_rank_ideas(stocks, close_ranges, args.count):
+        raise SystemExit("Vectorized scoring shortlist differs from the legacy scoring loop.")
+
+    legacy = min(
+        timeit.repeat(lambda: legacy_rank_ideas(stocks, close_ranges, args.count), number=1, repeat=args.repeat)
+    )
+    vectorized = min(
+        timeit.repeat(lambda: vectorized_rank_ideas(stocks, close_ranges, args.count), number=1, repeat=args.repeat)
+    )
+    print(f"{len(stocks)} synthetic symbols, best of {args.repeat}")
+    print(f"legacy per-stock loop   {legacy * 1000:8.2f} ms")
+    print(f"numpy column pipeline   {vectorized * 1000:8.2f} ms  ({legacy / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
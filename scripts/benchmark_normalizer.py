@@ -0,0 +1,153 @@
+import argparse
+import json
+from pathlib import Path
+import random
+import sys
+import timeit
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.app.ngx_client import _number, normalize_stock, normalize_stocks  # noqa: E402
+
+
+def _first(item: dict[str, Any], keys: list[str]) -> Any:
+    lowered = {str(key).lower(): value for key, value in item.items()}
+    for key in keys:
+        if key in item:
+            return item[key]
+        if key.lower() in lowered:
+            return lowered[key.lower()]
+    return None
+
+
+def legacy_normalize_stock(raw: dict[str, Any], source: str) -> dict[str, Any] | None:
+    symbol = _first(raw, ["SYMBOL", "symbol", "ticker", "code", "Symbol", "Ticker"])
+    if not symbol:
+        return None
+
+    symbol_text = str(symbol).strip().upper()
+    last_price = _number(_first(raw, ["Value", "last_price", "lastPrice", "price", "currentPrice", "close", "Close"]))
+    previous_close = _number(_first(raw, ["previous_close", "previousClose", "pclose", "prevClose"]))
+    raw_price_move = _number(
+        _first(raw, ["Change", "change", "PercChange", "percent_change", "changePercent", "percentageChange", "Change %"])
+    )
+    open_price = _number(_first(raw, ["Open", "open", "open_price"]))
+    if open_price in (None, 0) and last_price is not None and raw_price_move is not None:
+        derived_open = last_price - raw_price_move
+        if derived_open > 0:
+            open_price = derived_open
+    high_price = _number(_first(raw, ["High", "high", "high_price", "dayHigh"]))
+    low_price = _number(_first(raw, ["Low", "low", "low_price", "dayLow"]))
+    ngx_id = _first(raw, ["ngx_id", "ngxId", "isin", "ISIN"])
+    if ngx_id is None:
+        try:
+            from config import STOCK_ID_MAPPING
+        except Exception:
+            STOCK_ID_MAPPING = {}
+        ngx_id = STOCK_ID_MAPPING.get(symbol_text)
+
+    margin = _number(_first(raw, ["margin", "spread", "Spread"]))
+    if margin is None and high_price is not None and low_price is not None and last_price:
+        margin = ((high_price - low_price) / last_price) * 100
+
+    reference_price = previous_close if previous_close not in (None, 0) else open_price
+    computed_change: float | None = None
+    computed_percent_change: float | None = None
+    if raw_price_move is not None and open_price not in (None, 0):
+        computed_change = raw_price_move
+        computed_percent_change = (computed_change / open_price) * 100
+    elif last_price is not None and reference_price not in (None, 0):
+        computed_change = last_price - reference_price
+        computed_percent_change = (computed_change / reference_price) * 100
+
+    return {
+        "symbol": symbol_text,
+        "name": _first(raw, ["SYMBOL2", "Name", "TickerName", "name", "companyName", "company", "security", "Security"]),
+        "ticker_id": _first(raw, ["Id", "ticker_id", "tickerId", "id", "Ticker ID"]),
+        "ngx_id": ngx_id,
+        "sector": _first(raw, ["Sector", "sector"]),
+        "last_price": last_price,
+        "previous_close": previous_close,
+        "open_price": open_price,
+        "high_price": high_price,
+        "low_price": low_price,
+        "volume": _number(_first(raw, ["Volume", "volume"])),
+        "market_cap": _number(_first(raw, ["MarketCap", "market_cap", "marketCap", "Mkt Cap"])),
+        "change": computed_change if computed_change is not None else raw_price_move,
+        "percent_change": (
+            computed_percent_change
+            if computed_percent_change is not None
+            else raw_price_move
+        ),
+        "margin": margin,
+        "source": source,
+    }
+
+
+def generated_ticker_payload(rows: int) -> list[dict[str, Any]]:
+    rng = random.Random(42)
+    payload = []
+    for index in range(rows):
+        price = round(rng.uniform(0.5, 2000), 2)
+        change = round(price * rng.uniform(-0.1, 0.1), 2)
+        payload.append(
+            {
+                "Id": 1000 + index,
+                "SYMBOL": f"SYM{index:04d}",
+                "SYMBOL2": f"Synthetic Company {index} Plc",
+                "TickerType": "EQUITIES",
+                "Value": f"{price:,.2f}",
+                "Change": f"{change:.2f}",
+                "PercChange": f"{change / price * 100:.2f}%",
+                "Volume": f"{rng.randint(0, 50_000_000):,}",
+                "Sector": rng.choice(["FINANCIAL SERVICES", "INDUSTRIAL GOODS", "CONSUMER GOODS", "OIL AND GAS"]),
+            }
+        )
+    return payload
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the legacy and compiled NGX ticker normalizers.")
+    parser.add_argument("--payload", type=Path, help="Recorded ticker response (JSON list) to replay.")
+    parser.add_argument("--rows", type=int, default=1000, help="Generated payload size when --payload is not given.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.payload:
+        payload = json.loads(args.payload.read_text(encoding="utf-8"))
+        if isinstance(payload, dict):
+            payload = payload.get("data") or payload.get("stocks") or payload.get("results") or []
+    else:
+        payload = generated_ticker_payload(args.rows)
+
+    legacy_rows = [stock for item in payload if isinstance(item, dict) and (stock := legacy_normalize_stock(item, "bench"))]
+    compiled_rows = normalize_stocks(payload, "bench")
+    if legacy_rows != compiled_rows:
+        raise SystemExit("Compiled normalizer output differs from the legacy normalizer.")
+
+    legacy = min(
+        timeit.repeat(
+            lambda: [legacy_normalize_stock(item, "bench") for item in payload if isinstance(item, dict)],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    per_row = min(
+        timeit.repeat(
+            lambda: [normalize_stock(item, "bench") for item in payload if isinstance(item, dict)],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    compiled = min(timeit.repeat(lambda: normalize_stocks(payload, "bench"), number=1, repeat=args.repeat))
+    print(f"{len(payload)} ticker rows, best of {args.repeat}")
+    print(f"legacy _first lookups   {legacy * 1000:8.2f} ms")
+    print(f"per-row key plan        {per_row * 1000:8.2f} ms  ({legacy / per_row:.1f}x)")
+    print(f"compiled key plan       {compiled * 1000:8.2f} ms  ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
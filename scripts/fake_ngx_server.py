@@ -0,0 +1,321 @@
+import argparse
+import asyncio
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+import hashlib
+import json
+from pathlib import Path
+import random
+import re
+import shlex
+import sys
+import time
+from typing import Any
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import HTMLResponse, JSONResponse, Response  # noqa: E402
+
+from config import STOCK_ID_MAPPING  # noqa: E402
+
+
+NEWS_ID_PATTERN = re.compile(r"InternationSecIN eq '([^']+)'")
+FIXTURE_NAME_PATTERN = re.compile(r"[A-Z0-9][A-Z0-9._-]*")
+SECTORS = ["FINANCIAL SERVICES", "INDUSTRIAL GOODS", "CONSUMER GOODS", "OIL AND GAS", "ICT", "AGRICULTURE"]
+SUBMISSION_TYPES = ["Corporate Actions", "Corporate Disclosures", "Annual General Meeting"]
+NEWS_TITLES = [
+    "Audited Financial Statements for the Year Ended 31 December",
+    "Unaudited Q{quarter} Financial Statements",
+    "Notice of Board Meeting",
+    "Closed Period Notification",
+    "Earnings Forecast for Q{quarter}",
+    "Directors' Dealings Disclosure",
+    "Notice of Annual General Meeting",
+    "Interim Dividend Declaration",
+]
+
+
+def _seed(*parts: Any) -> int:
+    return int.from_bytes(hashlib.sha1(":".join(str(part) for part in parts).encode()).digest()[:8], "big")
+
+
+class FakeNgxUniverse:
+    def __init__(self, size: int, history_days: int, tick_seconds: float, fixtures: Path | None) -> None:
+        self.history_days = history_days
+        self.tick_seconds = max(1.0, tick_seconds)
+        self.fixtures = fixtures
+        self.stocks: list[dict[str, str]] = []
+        for symbol, ngx_id in list(STOCK_ID_MAPPING.items())[:size]:
+            self.stocks.append({"symbol": symbol, "ngx_id": ngx_id})
+        for index in range(size - len(self.stocks)):
+            self.stocks.append({"symbol": f"FAKE{index:04d}", "ngx_id": f"NGFAKE{index:06d}"})
+        self.by_symbol = {stock["symbol"]: stock for stock in self.stocks}
+        self.by_ngx_id = {stock["ngx_id"]: stock for stock in self.stocks}
+
+    def fixture(self, relative: str, name: str | None = None) -> Any:
+        if self.fixtures is None or (name is not None and not FIXTURE_NAME_PATTERN.fullmatch(name)):
+            return None
+        path = self.fixtures / relative
+        if not path.is_file():
+            return None
+        text = path.read_text(encoding="utf-8")
+        return text if path.suffix == ".html" else json.loads(text)
+
+    def base_price(self, symbol: str) -> float:
+        return round(random.Random(_seed("base", symbol)).uniform(0.5, 1500), 2)
+
+    def ticker(self, include_ngx_ids: bool) -> list[dict[str, Any]]:
+        recorded = self.fixture("ticker.json")
+        if recorded is not None:
+            return recorded
+
+        tick = int(time.time() // self.tick_seconds)
+        rows = []
+        for index, stock in enumerate(self.stocks):
+            symbol = stock["symbol"]
+            rng = random.Random(_seed("tick", symbol, tick))
+            base = self.base_price(symbol)
+            change = round(base * rng.uniform(-0.1, 0.1), 2) if rng.random() < 0.6 else 0.0
+            price = max(0.01, base + change)
+            row = {
+                "Id": 1000 + index,
+                "SYMBOL": symbol,
+                "SYMBOL2": f"{symbol.title()} Plc",
+                "TickerType": "EQUITIES",
+                "Value": f"{price:,.2f}",
+                "Change": f"{change:.2f}",
+                "PercChange": f"{change / base * 100:.2f}%",
+                "Volume": f"{random.Random(_seed('volume', symbol, tick)).randint(0, 50_000_000):,}",
+                "Sector": SECTORS[_seed("sector", symbol) % len(SECTORS)],
+            }
+            if include_ngx_ids:
+                row["ngx_id"] = stock["ngx_id"]
+            rows.append(row)
+        return rows
+
+    def chart(self, ngx_id: str) -> list[list[float]] | None:
+        recorded = self.fixture(f"chart/{ngx_id}.json", ngx_id)
+        if recorded is not None:
+            return recorded
+        stock = self.by_ngx_id.get(ngx_id)
+        if stock is None:
+            return None
+
+        rng = random.Random(_seed("chart", ngx_id))
+        price = self.base_price(stock["symbol"]) * rng.uniform(0.5, 1.2)
+        today = date.today()
+        points = []
+        for offset in range(self.history_days, 0, -1):
+            trade_date = today - timedelta(days=offset)
+            if trade_date.weekday() >= 5:
+                continue
+            price = max(0.01, price * (1 + rng.gauss(0.0004, 0.02)))
+            timestamp = datetime.combine(trade_date, dt_time(12), tzinfo=timezone.utc).timestamp()
+            points.append([int(timestamp * 1000), round(price, 2)])
+        return points
+
+    def news(self, ngx_ids: list[str], top: int | None) -> list[dict[str, Any]]:
+        recorded = self.fixture("news.json")
+        if recorded is not None:
+            results = recorded.get("d", {}).get("results", []) if isinstance(recorded, dict) else recorded
+            items = [item for item in results if not ngx_ids or item.get("InternationSecIN") in ngx_ids]
+            return items[:top] if top else items
+
+        items = []
+        for ngx_id in ngx_ids:
+            if ngx_id not in self.by_ngx_id:
+                continue
+            rng = random.Random(_seed("news", ngx_id))
+            modified = datetime.now(timezone.utc).replace(microsecond=0)
+            for index in range(rng.randint(3, 12)):
+                modified -= timedelta(days=rng.randint(2, 30))
+                title = rng.choice(NEWS_TITLES).format(quarter=rng.randint(1, 4))
+                items.append(
+                    {
+                        "Id": _seed("news-item", ngx_id, index) % 10_000_000,
+                        "URL": {
+                            "Description": f"{self.by_ngx_id[ngx_id]['symbol']} - {title}",
+                            "Url": f"https://doclib.ngxgroup.com/fake/{ngx_id}/{index}.pdf",
+                        },
+                        "Modified": modified.isoformat().replace("+00:00", "Z"),
+                        "InternationSecIN": ngx_id,
+                        "Type_of_Submission": rng.choice(SUBMISSION_TYPES),
+                    }
+                )
+        items.sort(key=lambda item: item["Modified"], reverse=True)
+        return items[:top] if top else items
+
+    def profile_html(self, symbol: str) -> str | None:
+        recorded = self.fixture(f"profile/{symbol}.html", symbol)
+        if recorded is not None:
+            return recorded
+        stock = self.by_symbol.get(symbol)
+        if stock is None:
+            return None
+        return (
+            "<html><body><table>"
+            f"<tr><td>Company Name:</td><td>{symbol.title()} Plc</td></tr>"
+            f"<tr><td>Website:</td><td><a href=\"https://www.{symbol.lower()}.example\">Visit website</a></td></tr>"
+            "</table>"
+            f"<script src=\"https://doclib.ngxgroup.com/REST/api/stockchartdata/{stock['ngx_id']}\"></script>"
+            "</body></html>"
+        )
+
+
+def create_app(args: argparse.Namespace) -> FastAPI:
+    universe = FakeNgxUniverse(args.universe_size, args.history_days, args.tick_seconds, args.fixtures)
+    rng = random.Random(args.seed)
+    app = FastAPI(title="Fake NGX doclib")
+
+    @app.middleware("http")
+    async def inject_latency_and_errors(request: Request, call_next):
+        delay_ms = max(0.0, rng.gauss(args.latency_ms, args.jitter_ms)) if args.jitter_ms else args.latency_ms
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+        if args.error_rate and rng.random() < args.error_rate:
+            return JSONResponse({"error": "injected failure"}, status_code=503)
+        return await call_next(request)
+
+    @app.get("/REST/api/statistics/ticker")
+    def ticker() -> JSONResponse:
+        return JSONResponse(universe.ticker(args.ticker_ngx_ids))
+
+    @app.get("/REST/api/stockchartdata/{ngx_id}")
+    def chart(ngx_id: str) -> Response:
+        points = universe.chart(ngx_id)
+        if points is None:
+            return JSONResponse({"error": "unknown chart id"}, status_code=404)
+        return JSONResponse(points)
+
+    @app.get("/REST/api/statistics/mktstatus")
+    def market_status() -> JSONResponse:
+        return JSONResponse(universe.fixture("mktstatus.json") or [{"MktStatus1": args.market_status}])
+
+    @app.get("/REST/api/mrkstat/mrksnapshot")
+    def market_snapshot() -> JSONResponse:
+        recorded = universe.fixture("mrksnapshot.json")
+        if recorded is not None:
+            return JSONResponse(recorded)
+        snapshot_rng = random.Random(_seed("snapshot", int(time.time() // universe.tick_seconds)))
+        return JSONResponse(
+            {
+                "ASI": round(snapshot_rng.uniform(95_000, 105_000), 2),
+                "DEALS": snapshot_rng.randint(5_000, 20_000),
+                "VOLUME": snapshot_rng.randint(200_000_000, 900_000_000),
+                "VALUE": round(snapshot_rng.uniform(4e9, 2e10), 2),
+                "CAP": round(snapshot_rng.uniform(5.5e13, 6.5e13), 2),
+                "BOND_CAP": round(snapshot_rng.uniform(2.5e13, 3e13), 2),
+                "ETF_CAP": round(snapshot_rng.uniform(5e10, 8e10), 2),
+            }
+        )
+
+    @app.get("/_api/Web/Lists/{list_ref}/items/")
+    def company_news(request: Request) -> JSONResponse:
+        ngx_ids = NEWS_ID_PATTERN.findall(request.query_params.get("$filter", ""))
+        top = request.query_params.get("$top")
+        return JSONResponse({"d": {"results": universe.news(ngx_ids, int(top) if top else None)}})
+
+    @app.get("/exchange/data/company-profile/")
+    def company_profile(symbol: str = "") -> Response:
+        html = universe.profile_html(symbol.strip().upper())
+        if html is None:
+            return HTMLResponse("<html><body>Company not found</body></html>", status_code=404)
+        return HTMLResponse(html)
+
+    return app
+
+
+def env_exports(base_url: str) -> list[str]:
+    return [
+        f"NGX_TICKER_URL={base_url}/REST/api/statistics/ticker",
+        f"NGX_CHART_BASE_URL={base_url}/REST/api/stockchartdata/",
+        f"MARKET_STATUS_URL={base_url}/REST/api/statistics/mktstatus",
+        f"MARKET_SNAPSHOT_URL={base_url}/REST/api/mrkstat/mrksnapshot",
+        f"COMPANY_NEWS_URL={base_url}/_api/Web/Lists/GetByTitle('XFinancial_News')/items/",
+        f"COMPANY_PROFILE_URL={base_url}/exchange/data/company-profile/",
+    ]
+
+
+def record_fixtures(output: Path, symbols: list[str]) -> None:
+    from backend.app.ngx_client import (
+        JSON_HEADERS,
+        NEWS_HEADERS,
+        PROFILE_HEADERS,
+        SNAPSHOT_HEADERS,
+        TICKER_PARAMS,
+        company_news_params,
+        company_profile_params,
+        parse_company_profile_html,
+    )
+    from backend.app.settings import get_settings
+
+    settings = get_settings()
+    session = requests.Session()
+
+    def save(relative: str, content: str) -> None:
+        path = output / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        print(f"recorded {path}")
+
+    def fetch(url: str, **kwargs: Any) -> requests.Response:
+        response = session.get(url, timeout=30, **kwargs)
+        response.raise_for_status()
+        return response
+
+    save("ticker.json", fetch(settings.ngx_ticker_url, params=TICKER_PARAMS, headers=JSON_HEADERS).text)
+    save("mktstatus.json", fetch(settings.market_status_url, headers=JSON_HEADERS).text)
+    save("mrksnapshot.json", fetch(settings.market_snapshot_url, headers=SNAPSHOT_HEADERS).text)
+
+    news_results = []
+    for symbol in symbols:
+        html = fetch(settings.company_profile_url, params=company_profile_params(symbol), headers=PROFILE_HEADERS).text
+        save(f"profile/{symbol}.html", html)
+        ngx_id = parse_company_profile_html(html)["ngx_id"] or STOCK_ID_MAPPING.get(symbol)
+        if not ngx_id:
+            continue
+        save(f"chart/{ngx_id}.json", fetch(f"{settings.ngx_chart_base_url}{ngx_id}").text)
+        payload = fetch(settings.company_news_url, params=company_news_params(ngx_id), headers=NEWS_HEADERS).json()
+        news_results.extend(payload.get("d", {}).get("results", []))
+    save("news.json", json.dumps({"d": {"results": news_results}}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake NGX doclib endpoints for offline load testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--universe-size", type=int, default=160, help="Number of listed equities to generate.")
+    parser.add_argument("--history-days", type=int, default=2 * 365, help="Calendar days of chart history per stock.")
+    parser.add_argument("--tick-seconds", type=float, default=60, help="How often generated ticker prices move.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Mean added latency per request.")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Standard deviation of the added latency.")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of requests answered with HTTP 503.")
+    parser.add_argument("--market-status", default="OPEN")
+    parser.add_argument("--ticker-ngx-ids", action="store_true", help="Include chart ids in the ticker payload.")
+    parser.add_argument("--fixtures", type=Path, help="Directory of recorded payloads to replay instead of generating.")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--record",
+        type=Path,
+        help="Record live NGX payloads for --record-symbols into this directory and exit.",
+    )
+    parser.add_argument("--record-symbols", default="GTCO,MTNN,ZENITHBANK")
+    args = parser.parse_args()
+
+    if args.record:
+        symbols = [symbol.strip().upper() for symbol in args.record_symbols.split(",") if symbol.strip()]
+        record_fixtures(args.record, symbols)
+        return
+
+    print("Point the API at this server with:")
+    for line in env_exports(f"http://{args.host}:{args.port}"):
+        print(f"  export {shlex.quote(line)}")
+    uvicorn.run(create_app(args), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()